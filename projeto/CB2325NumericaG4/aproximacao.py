@@ -6,6 +6,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 from sympy import symbols, Poly
 from scipy.optimize import minimize
+try:
+    from .utils import Polynomial
+except ImportError:
+    from utils import Polynomial
 
 
 def regressao_polinomial(pontos: list = None,
@@ -27,7 +31,7 @@ def regressao_polinomial(pontos: list = None,
     Retorna:
         Uma lista com os coeficientes do polinômio em ordem crescente de grau;
         Um float com o valor de R² da aproximação;
-        A função obtida em forma de callable;
+        A função obtida em forma de callable (um Polynomial, avaliado pelo método de Horner);
         A representação do polinômio em forma de string.
     """
 
@@ -72,7 +76,7 @@ def regressao_polinomial(pontos: list = None,
     string = polinomio1.as_expr() #Monta a representação do polinômio para o título
 
     # Função
-    f = lambda x: sum(coeficientes[i]*(x**i) for i in range(len(coeficientes)))
+    f = Polynomial(coeficientes)
 
     return coeficientes, R_squared, f, string
 
@@ -1,6 +1,10 @@
-import random
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy.stats import qmc
 
 
 Paleta = ["#084b83", "#680e4b", "#c42021", "#edae49"]
@@ -13,26 +17,42 @@ class IntegralNumerica:
     Propriedades:
     func (Callable): A função integrada.
     valor (float): O valor computado da integral numérica.
-    pontos (list[tuple]): Lista de pontos onde a função foi evaluada, na forma (x, f(x)).
+    pontos (np.ndarray ou None): Pontos onde a função foi evaluada, um por linha na forma (x, f(x)).
+    erro (float ou None): Estimativa do erro cometido, quando o método fornece uma.
+    avaliacoes (int ou None): Número de vezes que a função foi evaluada, quando o método o registra.
     """
 
-    def __init__(self, func, value, points):
+    def __init__(self, func, value, points, erro=None, avaliacoes=None):
         """
         Cria uma IntegralNumerica.
 
         Parâmetros:
         valor (float): O valor computado da integral numérica.
-        pontos (list[tuple]): Lista de pontos onde a função foi evaluada, na forma (x, f(x)). 
+        pontos (np.ndarray, Callable ou None): Pontos onde a função foi evaluada, um por linha na forma (x, f(x)).
+        Se for uma função sem argumentos, os pontos só são gerados (por ela) quando acessados pela primeira vez;
+        se for None, os pontos não foram registrados.
+        erro (float ou None): Estimativa do erro cometido.
+        avaliacoes (int ou None): Número de vezes que a função foi evaluada.
         """
         self.func = func
         self.valor = value
-        self.pontos = points
+        self._pontos = points
+        self.erro = erro
+        self.avaliacoes = avaliacoes
+
+    @property
+    def pontos(self):
+        if callable(self._pontos):
+            self._pontos = self._pontos()   # Regenera os pontos sob demanda
+        return self._pontos
     
     def __repr__(self):
         return str(self.valor)
     
     def __getitem__(self, index):
-        return self.points[index]
+        if self.pontos is None:
+            raise ValueError("Os pontos desta integral não foram registrados (record_points='off').")
+        return self.pontos[index]
     
 
 class IntegralReal(IntegralNumerica):
@@ -42,12 +62,16 @@ class IntegralReal(IntegralNumerica):
     Propriedades:
     min (float): O valor mínimo do domínio.
     max (float): O valor máximo do domínio.
+    n (int ou None): O número de subdivisões usado pela regra.
+    regra (str ou None): O nome da regra de integração utilizada.
     """
 
-    def __init__(self, func, value, points, min, max):
+    def __init__(self, func, value, points, min, max, n=None, regra=None, erro=None, avaliacoes=None):
         self.min = min
         self.max = max
-        super().__init__(func, value, points)
+        self.n = n
+        self.regra = regra
+        super().__init__(func, value, points, erro, avaliacoes)
     
     def create_plot(self, color=Paleta[0]):
         """
@@ -60,7 +84,7 @@ class IntegralReal(IntegralNumerica):
         """
         fig, ax = plt.subplots()
         X = np.linspace(self.min, self.max, 500)
-        Y = self.func(X)
+        Y = _avaliar(self.func, X)
         ax.plot(X, Y, color=color, label="Curva")
         ax.set_xlabel('Eixo X')
         ax.set_ylabel('Eixo Y')
@@ -76,6 +100,8 @@ class IntegralReal(IntegralNumerica):
         ax: Objeto de eixos do Matplotlib.
         color (str): A cor dos pontos.
         """
+        if self.pontos is None:
+            raise ValueError("Os pontos desta integral não foram registrados (record_points='off').")
         px, py = zip(*self.pontos)
         marker, stemlines, baseline = ax.stem(px, py, "--", label = "Pontos")
         plt.setp(marker, 'color', color)
@@ -83,7 +109,302 @@ class IntegralReal(IntegralNumerica):
         plt.setp(baseline, 'color', color)
 
 
-def integral_trap(funcao, a, b, n=1000) -> IntegralReal:
+class IntegralCumulativa(IntegralReal):
+    """
+    Representa a integral acumulada F(x) = ∫_min^x f de uma função, tabelada em uma malha.
+    Pode ser chamada como uma função: F(x) é obtida interpolando a tabela (interpolação cúbica
+    de Hermite, usando F' = f nos nós).
+
+    Propriedades:
+    x (np.ndarray): Nós da malha, em ordem crescente (mesmo que a integração seja de min > max).
+    F (np.ndarray): Valores da integral acumulada em cada nó.
+    fx (np.ndarray): Valores da função integrada em cada nó.
+    """
+
+    def __init__(self, func, x, F, fx, points, regra=None):
+        valor, a, b = float(F[-1]), x[0], x[-1]
+        if a > b:
+            # Limites invertidos: F(x) = ∫_a^x f continua valendo, só a tabela é guardada em x crescente
+            x, F, fx = x[::-1].copy(), F[::-1].copy(), fx[::-1].copy()
+        self.x = x
+        self.F = F
+        self.fx = fx
+        super().__init__(func, valor, points, a, b, len(x) - 1, regra)
+
+    def __call__(self, x_desejado):
+        """
+        Avalia a integral acumulada F(x_desejado). Retorna NaN para pontos fora de [min, max].
+
+        Parâmetros:
+        x_desejado (float ou array): Ponto(s) onde F é avaliada.
+
+        Retorna: Um float ou um array com os valores de F.
+        """
+        t = np.asarray(x_desejado, dtype=float)
+        i = np.clip(np.searchsorted(self.x, t, side="right") - 1, 0, len(self.x) - 2)
+        h = self.x[i + 1] - self.x[i]
+        s = (t - self.x[i])/h
+        s2, s3 = s*s, s*s*s
+        F = (
+            (2*s3 - 3*s2 + 1)*self.F[i] + (s3 - 2*s2 + s)*h*self.fx[i]
+            + (3*s2 - 2*s3)*self.F[i + 1] + (s3 - s2)*h*self.fx[i + 1]
+        )
+        F = np.where((t < self.x[0]) | (t > self.x[-1]), np.nan, F)    # Retorna NaN para extrapolação
+        return F.item() if F.ndim == 0 else F
+    
+
+def _avaliar(funcao, X, vetorizar=True):
+    """
+    Avalia a função em todos os nós de uma só vez, quando possível.
+
+    Parâmetros:
+    funcao: Função a ser avaliada;
+    X (np.ndarray): Nós onde a função deve ser avaliada;
+    vetorizar (bool): Se True, tenta chamar a função uma única vez sobre o array inteiro.
+    Funções que não aceitam arrays (como math.sin) são avaliadas ponto a ponto.
+
+    Retorna: "(np.ndarray) Valores da função em cada um dos nós."
+    """
+    return _avaliar_coordenadas(funcao, (X,), vetorizar)
+
+
+def _avaliar_coordenadas(funcao, coordenadas, vetorizar=True):
+    """
+    Avalia uma função de várias variáveis em todos os pontos de uma só vez, quando possível.
+
+    Parâmetros:
+    funcao: Função a ser avaliada, chamada como funcao(x, y, ...);
+    coordenadas (tuple[np.ndarray]): Um array por variável, todos com o mesmo tamanho;
+    vetorizar (bool): Se True, tenta chamar a função uma única vez sobre os arrays inteiros.
+
+    Retorna: "(np.ndarray) Valores da função em cada um dos pontos."
+    """
+    if vetorizar:
+        try:
+            Y = np.asarray(funcao(*coordenadas), dtype=float)
+            if Y.shape == coordenadas[0].shape:
+                return Y
+        except (TypeError, ValueError):
+            pass    # A função não é vetorizável; avalia ponto a ponto.
+    pontos = zip(*(C.tolist() for C in coordenadas))
+    return np.fromiter((funcao(*p) for p in pontos), dtype=float, count=len(coordenadas[0]))
+
+
+def _somar(valores, soma="pareada"):
+    """
+    Soma os valores de um array com o modo de acumulação escolhido.
+
+    Parâmetros:
+    valores (np.ndarray): Valores a serem somados;
+    soma (str): "pareada" usa a soma em pares do NumPy (erro de arredondamento O(log n));
+    "compensada" soma em pares guardando o erro de arredondamento de cada adição (ver
+    _soma_compensada), com resultado tão preciso quanto o de uma soma em precisão dupla-dupla.
+
+    Retorna: "(float) A soma dos valores."
+    """
+    if soma == "pareada":
+        return float(np.sum(valores))
+    elif soma == "compensada":
+        return _soma_compensada(valores)
+    else:
+        raise ValueError("Modo de soma inválido!")
+
+
+def _soma_exata(a, b):
+    """
+    Transformação sem erro TwoSum: s = fl(a + b) e e tais que a + b = s + e exatamente.
+    """
+    s = a + b
+    b_virtual = s - a
+    return s, (a - (s - b_virtual)) + (b - b_virtual)
+
+
+def _soma_compensada(valores, bloco=65_536):
+    """
+    Soma compensada vetorizada: em cada bloco de tamanho fixo, os valores são somados em
+    pares (uma árvore de somas) com TwoSum, e os erros de cada nível são acumulados à parte.
+    Os resultados dos blocos são combinados pela soma compensada de Neumaier. A memória
+    extra é limitada pelo tamanho do bloco, e não há conversão para floats do Python.
+
+    Retorna: "(float) A soma dos valores."
+    """
+    x = np.ravel(np.asarray(valores, dtype=float))
+    total, compensacao = 0.0, 0.0
+    for inicio in range(0, len(x), bloco):
+        s = x[inicio:inicio + bloco]
+        erro = 0.0
+        while len(s) > 1:
+            if len(s) % 2 == 1:
+                s = np.append(s, 0.0)
+            with np.errstate(invalid="ignore"):
+                s, e = _soma_exata(s[0::2], s[1::2])
+            erro += float(np.sum(e))
+        for parcela in (float(s[0]), erro):
+            t = total + parcela
+            if abs(total) >= abs(parcela):
+                compensacao += (total - t) + parcela
+            else:
+                compensacao += (parcela - t) + total
+            total = t
+    resultado = total + compensacao
+    if not math.isfinite(resultado):
+        return float(np.sum(x))     # Infinitos ou NaN: os termos de erro não fazem sentido
+    return resultado
+
+
+def _acumular(valores, soma="pareada"):
+    """
+    Calcula as somas acumuladas de um array com o modo de acumulação escolhido.
+
+    Parâmetros:
+    valores (np.ndarray): Valores a serem acumulados;
+    soma (str): "pareada" usa np.cumsum; "compensada" corrige cada soma acumulada com os
+    erros exatos (TwoSum) de todas as adições anteriores.
+
+    Retorna: "(np.ndarray) Array com as somas acumuladas."
+    """
+    if soma == "pareada":
+        return np.cumsum(valores)
+    elif soma == "compensada":
+        x = np.asarray(valores, dtype=float)
+        S = np.cumsum(x)
+        with np.errstate(invalid="ignore"):
+            _, e = _soma_exata(S[:-1], x[1:])     # S[i] = fl(S[i-1] + x[i]): o erro de cada adição
+            corrigido = S[1:] + np.cumsum(e)
+        S[1:] = np.where(np.isfinite(corrigido), corrigido, S[1:])
+        return S
+    else:
+        raise ValueError("Modo de soma inválido!")
+
+
+def _pontos(funcao, nos, vetorizar=True):
+    """
+    Gera os pontos (x, f(x)) de uma integral a partir dos seus nós.
+
+    Parâmetros:
+    funcao: Função integrada;
+    nos (Callable): Função sem argumentos que retorna os nós da regra;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre todos os nós.
+
+    Retorna: "(np.ndarray) Array de formato (N, 2) com um ponto (x, f(x)) por linha."
+    """
+    X = nos()
+    return np.column_stack((X, _avaliar(funcao, X, vetorizar)))
+
+
+def _registrar_pontos(record_points, pontos, gerar):
+    """
+    Escolhe o que uma integral guarda sobre os pontos onde a função foi avaliada.
+
+    Parâmetros:
+    record_points (str): "full" guarda os pontos já calculados; "lazy" guarda apenas como
+    regenerá-los quando forem pedidos; "off" não guarda nada;
+    pontos (Callable): Função sem argumentos que monta os pontos já calculados;
+    gerar (Callable): Função sem argumentos que regenera os pontos, reavaliando a função.
+
+    Retorna: O argumento 'points' a ser passado para a IntegralNumerica.
+    """
+    if record_points == "full":
+        return pontos()
+    elif record_points == "lazy":
+        return gerar
+    elif record_points == "off":
+        return None
+    else:
+        raise ValueError("Modo de registro de pontos inválido!")
+
+
+def _mapear(tarefa, argumentos, executor=None, workers=None):
+    """
+    Executa tarefa(*args) para cada args de 'argumentos', devolvendo os resultados na mesma ordem.
+
+    Parâmetros:
+    tarefa: Função a ser executada (deve ser definida no nível do módulo para rodar em processos);
+    argumentos (list[tuple]): Argumentos de cada execução;
+    executor (concurrent.futures.Executor ou None): Pool já existente onde as tarefas são executadas;
+    workers (int ou None): Se não houver executor, número de processos de um ProcessPoolExecutor
+    criado apenas para esta chamada. Se ambos forem None, as tarefas rodam em série.
+
+    Retorna: Gerador com os resultados de cada tarefa. Se for interrompido, cancela as tarefas pendentes.
+    """
+    if executor is None and workers is None:
+        for args in argumentos:
+            yield tarefa(*args)
+        return
+
+    proprio = executor is None
+    if proprio:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    futuros = [executor.submit(tarefa, *args) for args in argumentos]
+    try:
+        for futuro in futuros:
+            yield futuro.result()
+    finally:
+        for futuro in futuros:
+            futuro.cancel()
+        if proprio:
+            executor.shutdown()
+
+
+def _soma_parcial(funcao, regra, a, b, n, inicio, fim, vetorizar=True, registrar=False, soma="pareada"):
+    """
+    Calcula a contribuição dos nós de índices inicio, ..., fim - 1 para uma regra composta.
+
+    Parâmetros:
+    funcao: Função a ser integrada;
+    regra (str): "trap", "rect" ou "simpson";
+    a, b (float): Limites de integração;
+    n (int): Número de subdivisões da regra;
+    inicio, fim (int): Índices (da malha completa de nós) tratados por esta parte;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre os nós da parte;
+    registrar (bool): Se os nós e valores avaliados devem ser devolvidos;
+    soma (str): Modo de acumulação ("pareada" ou "compensada").
+
+    Retorna: "(tuple) Soma dos valores da função nesses nós, ponderados pelos pesos relativos da
+    regra (sem o fator dx), e, se registrar for True, os arrays de nós e valores."
+    """
+    total = 2*n + 1 if regra == "simpson" else n + 1
+    indices = np.arange(inicio, fim)
+    X = indices*((b - a)/(total - 1)) + a       # Os mesmos nós de np.linspace(a, b, total)
+    if fim == total:
+        X[-1] = b
+    Y = _avaliar(funcao, X, vetorizar)
+
+    # Pesos relativos (sem o fator dx): multiplicar por eles é exato em ponto flutuante
+    extremos = (indices == 0) | (indices == total - 1)
+    if regra == "trap":
+        pesos = np.where(extremos, 0.5, 1.0)
+    elif regra == "rect":
+        pesos = np.where(indices == total - 1, 0.0, 1.0)
+    else:
+        pesos = np.where(extremos, 1.0, np.where(indices % 2 == 1, 4.0, 2.0))
+    return _somar(pesos*Y, soma), (X, Y) if registrar else None
+
+
+def _quadratura_paralela(funcao, regra, a, b, n, vetorizar, executor, workers, registrar=False, soma="pareada"):
+    """
+    Calcula uma regra composta dividindo os nós em partes que são processadas em paralelo.
+    As somas parciais são combinadas com soma compensada (math.fsum).
+
+    Retorna: "(tuple) Valor da integral e os arrays de nós e valores (None se registrar for False)."
+    """
+    total = 2*n + 1 if regra == "simpson" else n + 1
+    partes = min(4*(workers or os.cpu_count() or 1), total)
+    limites = np.linspace(0, total, partes + 1).astype(int)
+    argumentos = [
+        (funcao, regra, a, b, n, inicio, fim, vetorizar, registrar, soma)
+        for inicio, fim in zip(limites[:-1], limites[1:]) if fim > inicio
+    ]
+    somas, avaliados = zip(*_mapear(_soma_parcial, argumentos, executor, workers))
+    s = math.fsum(somas)*((b - a)/n)/(6 if regra == "simpson" else 1)
+    if not registrar:
+        return s, None, None
+    X, Y = zip(*avaliados)
+    return s, np.concatenate(X), np.concatenate(Y)
+
+
+def integral_trap(funcao, a, b, n=1000, vetorizar=True, soma="pareada", executor=None, workers=None,
+                  record_points="lazy") -> IntegralReal:
     """
     Objetivos: - "Essa função calcula a integral numérica pelo método dos trapézios".   
 
@@ -91,19 +412,34 @@ def integral_trap(funcao, a, b, n=1000) -> IntegralReal:
     funcao: Função a ser integrada;  
     a (float): Limite inferior de integração;
     b (float): Limite superior de integração;  
-    n (int): Número de subdivisões.
+    n (int): Número de subdivisões;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre todos os nós;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    executor (concurrent.futures.Executor ou None): Pool onde partes de [a, b] são calculadas em paralelo;
+    workers (int ou None): Se não houver executor, número de processos usados. Com processos, a
+    função deve poder ser serializada (definida no nível de um módulo, não uma lambda);
+    record_points (str): Como os pontos avaliados são registrados: "full" (guardados),
+    "lazy" (regenerados apenas se forem acessados) ou "off" (descartados).
 
     Retorna: "(IntegralReal) Objeto representando o resultado da computação."
     """
 
     dx = (b-a)/n
-    s = 0
-    p = []
-    for c in range(n):
-        s += (funcao(a + c*dx) + funcao(a + (c+1)*dx))*(dx/2)
-        p.append((a + c*dx, funcao(a + c*dx)))
-    p.append((b, funcao(b)))
-    return IntegralReal(funcao, s, p, a, b)
+    if executor is not None or workers is not None:
+        s, X, Y = _quadratura_paralela(
+            funcao, "trap", a, b, n, vetorizar, executor, workers, record_points == "full", soma
+        )
+    else:
+        X = np.linspace(a, b, n + 1)
+        Y = _avaliar(funcao, X, vetorizar)     # Cada nó é avaliado uma única vez
+        s = (_somar(Y[1:-1], soma) + (Y[0] + Y[-1])/2)*dx
+    p = _registrar_pontos(
+        record_points,
+        lambda: np.column_stack((X, Y)),
+        partial(_pontos, funcao, partial(np.linspace, a, b, n + 1), vetorizar),
+    )
+    return IntegralReal(funcao, float(s), p, a, b, n, "trap")
 
 
 def plot_integral_trap(f, a, b, n=1000, simple=True, salvar_como=None) -> IntegralReal:
@@ -121,7 +457,7 @@ def plot_integral_trap(f, a, b, n=1000, simple=True, salvar_como=None) -> Integr
     Retorna: "(IntegralReal) Objeto representando o resultado da computação."
     """
     Paleta = ["#084b83", "#680e4b", "#c42021", "#edae49"]
-    integral = integral_trap(f, a, b, n)
+    integral = integral_trap(f, a, b, n, record_points="full")
 
     fig, ax = integral.create_plot()
     px, py = zip(*integral.pontos)
@@ -144,7 +480,8 @@ def plot_integral_trap(f, a, b, n=1000, simple=True, salvar_como=None) -> Integr
     return integral
 
 
-def integral_rect(funcao, a, b, n=1000) -> IntegralReal:
+def integral_rect(funcao, a, b, n=1000, vetorizar=True, soma="pareada", executor=None, workers=None,
+                  record_points="lazy") -> IntegralReal:
 
     """
     Objetivos: - "Essa função calcula a integral numérica por retângulos".   
@@ -153,19 +490,34 @@ def integral_rect(funcao, a, b, n=1000) -> IntegralReal:
     funcao: Função a ser integrada;  
     a (float): Limite inferior de integração;
     b (float): Limite superior de integração;  
-    n (int): Número de subdivisões.
+    n (int): Número de subdivisões;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre todos os nós;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    executor (concurrent.futures.Executor ou None): Pool onde partes de [a, b] são calculadas em paralelo;
+    workers (int ou None): Se não houver executor, número de processos usados. Com processos, a
+    função deve poder ser serializada (definida no nível de um módulo, não uma lambda);
+    record_points (str): Como os pontos avaliados são registrados: "full" (guardados),
+    "lazy" (regenerados apenas se forem acessados) ou "off" (descartados).
 
     Retorna: "(IntegralReal) Objeto representando o resultado da computação."
     """
 
     dx = (b-a)/n    
-    s = 0
-    p = []
-    for c in range(n):
-        s += (funcao(a + c*dx))*dx
-        p.append((a + c*dx, funcao(a + c*dx)))
-    p.append((b, funcao(b)))
-    return IntegralReal(funcao, s, p, a, b)
+    if executor is not None or workers is not None:
+        s, X, Y = _quadratura_paralela(
+            funcao, "rect", a, b, n, vetorizar, executor, workers, record_points == "full", soma
+        )
+    else:
+        X = np.linspace(a, b, n + 1)
+        Y = _avaliar(funcao, X, vetorizar)
+        s = _somar(Y[:-1], soma)*dx         # Retângulos à esquerda; f(b) só entra nos pontos
+    p = _registrar_pontos(
+        record_points,
+        lambda: np.column_stack((X, Y)),
+        partial(_pontos, funcao, partial(np.linspace, a, b, n + 1), vetorizar),
+    )
+    return IntegralReal(funcao, float(s), p, a, b, n, "rect")
 
 
 def plot_integral_rect(f, a, b, n=1000, simple=True, salvar_como=None) -> IntegralReal:
@@ -183,7 +535,7 @@ def plot_integral_rect(f, a, b, n=1000, simple=True, salvar_como=None) -> Integr
     Retorna: "(IntegralReal) Objeto representando o resultado da computação."
     """
     Paleta = ["#084b83", "#680e4b", "#c42021", "#edae49"]
-    integral = integral_rect(f, a, b, n)
+    integral = integral_rect(f, a, b, n, record_points="full")
 
     fig, ax = integral.create_plot()
     dpx, dpy = [a], [0]
@@ -214,7 +566,8 @@ def plot_integral_rect(f, a, b, n=1000, simple=True, salvar_como=None) -> Integr
     return integral
 
 
-def integral_simpson(funcao, a, b, n=1000) -> IntegralReal:
+def integral_simpson(funcao, a, b, n=1000, vetorizar=True, soma="pareada", executor=None, workers=None,
+                     record_points="lazy") -> IntegralReal:
     """
     Objetivos: - "Essa função calcula a integral numérica pelo método de Simpson".   
 
@@ -222,22 +575,34 @@ def integral_simpson(funcao, a, b, n=1000) -> IntegralReal:
     funcao: Função a ser integrada;  
     a (float): Limite inferior de integração;
     b (float): Limite superior de integração;  
-    n (int): Número de subdivisões.
+    n (int): Número de subdivisões;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre todos os nós;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    executor (concurrent.futures.Executor ou None): Pool onde partes de [a, b] são calculadas em paralelo;
+    workers (int ou None): Se não houver executor, número de processos usados. Com processos, a
+    função deve poder ser serializada (definida no nível de um módulo, não uma lambda);
+    record_points (str): Como os pontos avaliados são registrados: "full" (guardados),
+    "lazy" (regenerados apenas se forem acessados) ou "off" (descartados).
 
     Retorna: "(IntegralReal) Objeto representando o resultado da computação."
     """
 
     dx = (b-a)/n    
-    s = 0
-    p = []
-    for c in range(n):
-        s += (funcao(a + c*dx) + 4 * funcao((a + a + c * dx + (c+1) * dx)/2) + funcao(a + (c+1)*dx))*(dx/6)         #Calcula as aproximações
-        p += [
-            (a + c*dx, funcao(a + c*dx)),
-            ((a + a + c * dx + (c+1) * dx)/2, funcao((a + a + c * dx + (c+1) * dx)/2))
-        ]
-    p.append((b, funcao(b)))
-    return IntegralReal(funcao, s, p, a, b)
+    if executor is not None or workers is not None:
+        s, X, Y = _quadratura_paralela(
+            funcao, "simpson", a, b, n, vetorizar, executor, workers, record_points == "full", soma
+        )
+    else:
+        X = np.linspace(a, b, 2*n + 1)      # Extremos dos subintervalos intercalados com os pontos médios
+        Y = _avaliar(funcao, X, vetorizar)
+        s = (Y[0] + Y[-1] + 4*_somar(Y[1::2], soma) + 2*_somar(Y[2:-1:2], soma))*(dx/6)
+    p = _registrar_pontos(
+        record_points,
+        lambda: np.column_stack((X, Y)),
+        partial(_pontos, funcao, partial(np.linspace, a, b, 2*n + 1), vetorizar),
+    )
+    return IntegralReal(funcao, float(s), p, a, b, n, "simpson")
 
 
 def plot_integral_simpson(f, a, b, n=1000, simple=True, salvar_como=None) -> IntegralReal:
@@ -254,7 +619,7 @@ def plot_integral_simpson(f, a, b, n=1000, simple=True, salvar_como=None) -> Int
 
     Retorna: "(IntegralReal) Objeto representando o resultado da computação."
     """
-    integral = integral_simpson(f, a, b, n)
+    integral = integral_simpson(f, a, b, n, record_points="full")
 
     def p2(x0, x1, x2, y0, y1, y2):
         L0x = lambda x: ((x - x1) * (x - x2)) / ((x0 - x1) * (x0 - x2))
@@ -299,7 +664,634 @@ def plot_integral_simpson(f, a, b, n=1000, simple=True, salvar_como=None) -> Int
     return integral
 
 
-def monteCarlo(funcao, a, b, c, d, n=1000) -> IntegralNumerica:
+def _simpson_adaptativo(f, cache, a, fa, m, fm, b, fb, inteiro, tol, prof, max_avaliacoes):
+    """
+    Passo recursivo do método de Simpson adaptativo no intervalo [a, b], de ponto médio m.
+
+    Parâmetros:
+    f: Função a ser integrada (com cache de avaliações);
+    cache (dict): Avaliações já feitas por f (o seu tamanho é o número de avaliações);
+    a, m, b (float): Extremos e ponto médio do intervalo;
+    fa, fm, fb (float): Valores de f em a, m e b, já calculados;
+    inteiro (float): Aproximação de Simpson no intervalo inteiro;
+    tol (float): Tolerância de erro neste intervalo;
+    prof (int): Número máximo de subdivisões restantes;
+    max_avaliacoes (int): Número máximo de avaliações de f no total.
+
+    Retorna: "(tuple) Aproximação da integral em [a, b] e a estimativa do seu erro."
+    """
+    lm, rm = (a + m)/2, (m + b)/2
+    flm, frm = f(lm), f(rm)
+    esq = (m - a)*(fa + 4*flm + fm)/6
+    dir = (b - m)*(fm + 4*frm + fb)/6
+    delta = esq + dir - inteiro
+    # A tolerância não pode ficar abaixo do erro de arredondamento da própria aproximação
+    tol_efetiva = max(tol, np.finfo(float).eps*abs(esq + dir))
+    if (prof <= 0 or abs(delta) <= 15*tol_efetiva or len(cache) + 4 > max_avaliacoes
+            or lm in (a, m) or rm in (m, b)):       # Os pontos médios não separam mais o intervalo
+        # Extrapolação de Richardson: o erro de Simpson cai 16 vezes ao dividir o passo
+        return esq + dir + delta/15, abs(delta)/15
+    valor_esq, erro_esq = _simpson_adaptativo(f, cache, a, fa, lm, flm, m, fm, esq, tol/2, prof - 1, max_avaliacoes)
+    if len(cache) + 2 > max_avaliacoes:
+        # Orçamento esgotado pela metade da esquerda: a da direita fica com a aproximação já calculada
+        return valor_esq + dir + delta/30, erro_esq + abs(delta)/30
+    valor_dir, erro_dir = _simpson_adaptativo(f, cache, m, fm, rm, frm, b, fb, dir, tol/2, prof - 1, max_avaliacoes)
+    return valor_esq + valor_dir, erro_esq + erro_dir
+
+
+def integral_simpson_adaptativa(funcao, a, b, tol=1e-8, n=1, max_prof=50, max_avaliacoes=100_000,
+                                soma="pareada", record_points="lazy") -> IntegralReal:
+    """
+    Objetivos: - "Essa função calcula a integral numérica pelo método de Simpson adaptativo,
+    subdividindo apenas os subintervalos onde o erro estimado excede a tolerância".
+
+    Parâmetros:
+    funcao: Função a ser integrada;
+    a (float): Limite inferior de integração;
+    b (float): Limite superior de integração;
+    tol (float): Tolerância para o erro estimado;
+    n (int): Número de subintervalos iniciais (útil para não "pular" picos estreitos);
+    max_prof (int): Número máximo de subdivisões sucessivas de um mesmo subintervalo;
+    max_avaliacoes (int): Número máximo de avaliações da função; ao atingi-lo, as subdivisões param
+    e o erro estimado até ali é o retornado;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    record_points (str): Como os pontos avaliados são registrados: "full" (guardados),
+    "lazy" (recalculados apenas se forem acessados) ou "off" (descartados).
+
+    Retorna: "(IntegralReal) Objeto representando o resultado da computação,
+    com a estimativa de erro e o número de avaliações da função."
+
+    A tolerância nunca fica abaixo do erro de arredondamento da aproximação (eps*|S|), então
+    uma tol pequena demais para a escala da função não causa subdivisões inúteis.
+    """
+
+    cache = {}
+    def f(x):
+        # Nenhum nó é avaliado duas vezes
+        if x not in cache:
+            cache[x] = funcao(x)
+        return cache[x]
+
+    X = np.linspace(a, b, n + 1).tolist()
+    iniciais = []
+    for x0, x1 in zip(X[:-1], X[1:]):
+        m = (x0 + x1)/2
+        f0, fm, f1 = f(x0), f(m), f(x1)
+        iniciais.append((x0, f0, m, fm, x1, f1, (x1 - x0)*(f0 + 4*fm + f1)/6))
+    tol_efetiva = max(tol, np.finfo(float).eps*sum(abs(inicial[-1]) for inicial in iniciais))
+
+    valores, erros = [], []
+    for x0, f0, m, fm, x1, f1, inteiro in iniciais:
+        valor, erro_local = _simpson_adaptativo(f, cache, x0, f0, m, fm, x1, f1, inteiro, tol_efetiva/n, max_prof, max_avaliacoes)
+        valores.append(valor)
+        erros.append(erro_local)
+    s, erro = _somar(valores, soma), _somar(erros, soma)
+    p = _registrar_pontos(
+        record_points,
+        lambda: np.array(sorted(cache.items()), dtype=float),
+        lambda: integral_simpson_adaptativa(funcao, a, b, tol, n, max_prof, max_avaliacoes, soma, "full").pontos,
+    )
+    return IntegralReal(funcao, float(s), p, a, b, n, "simpson_adaptativa", float(erro), len(cache))
+
+
+def integral_romberg(funcao, a, b, tol=1e-10, n=1, max_iter=20, vetorizar=True, soma="pareada",
+                     record_points="lazy") -> IntegralReal:
+    """
+    Objetivos: - "Essa função calcula a integral numérica pelo método de Romberg: a regra dos trapézios
+    é refinada dividindo o passo pela metade, reaproveitando todas as avaliações anteriores, e a
+    extrapolação de Richardson é aplicada às aproximações obtidas".
+
+    Parâmetros:
+    funcao: Função a ser integrada;
+    a (float): Limite inferior de integração;
+    b (float): Limite superior de integração;
+    tol (float): Tolerância para a diferença entre duas extrapolações consecutivas;
+    n (int): Número de subdivisões da regra dos trapézios inicial;
+    max_iter (int): Número máximo de vezes que o passo é dividido pela metade;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre os novos nós de cada nível;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    record_points (str): Como os pontos avaliados são registrados: "full" (guardados),
+    "lazy" (regenerados apenas se forem acessados) ou "off" (descartados).
+
+    Retorna: "(IntegralReal) Objeto representando o resultado da computação,
+    com a estimativa de erro e o número de avaliações da função."
+    """
+
+    trap = integral_trap(funcao, a, b, n, vetorizar, soma, record_points="full" if record_points == "full" else "off")
+    avaliados = [trap.pontos] if record_points == "full" else []
+    avaliacoes = n + 1
+    R = [trap.valor]        # Linha atual da tabela de Romberg
+    erro = np.inf
+    for k in range(1, max_iter + 1):
+        h = (b - a)/(2*n)
+        X = a + h*np.arange(1, 2*n, 2)      # Somente os novos pontos médios
+        Y = _avaliar(funcao, X, vetorizar)
+        avaliacoes += n
+        if record_points == "full":
+            avaliados.append(np.column_stack((X, Y)))
+        n *= 2
+
+        nova = [R[0]/2 + h*_somar(Y, soma)]
+        for j in range(1, k + 1):
+            nova.append(nova[j - 1] + (nova[j - 1] - R[j - 1])/(4**j - 1))
+        erro = abs(nova[-1] - R[-1])
+        R = nova
+        if erro <= tol:
+            break
+
+    def pontos_avaliados():
+        P = np.concatenate(avaliados)
+        return P[np.argsort(P[:, 0])]
+
+    p = _registrar_pontos(
+        record_points,
+        pontos_avaliados,
+        partial(_pontos, funcao, partial(np.linspace, a, b, n + 1), vetorizar),
+    )
+    return IntegralReal(funcao, float(R[-1]), p, a, b, n, "romberg", float(erro), avaliacoes)
+
+
+@lru_cache(maxsize=64)
+def _nos_pesos_gauss(ordem):
+    """
+    Calcula (uma única vez por ordem) os nós e pesos de Gauss-Legendre em [-1, 1].
+
+    Parâmetros:
+    ordem (int): Número de nós da regra.
+
+    Retorna: "(tuple) Arrays (somente leitura) com os nós e os pesos."
+    """
+    t, w = np.polynomial.legendre.leggauss(ordem)
+    t.setflags(write=False)     # Os arrays são compartilhados entre chamadas pelo cache
+    w.setflags(write=False)
+    return t, w
+
+
+def _nos_gauss(a, b, ordem, m):
+    """
+    Retorna os nós da regra de Gauss-Legendre composta com m painéis em [a, b], em ordem crescente.
+    """
+    t, _ = _nos_pesos_gauss(ordem)
+    h = (b - a)/m
+    centros = a + h*(np.arange(m) + 0.5)
+    return (centros[:, None] + (h/2)*t).ravel()
+
+
+def integral_gauss(funcao, a, b, ordem=5, m=1, vetorizar=True, soma="pareada", record_points="lazy") -> IntegralReal:
+    """
+    Objetivos: - "Essa função calcula a integral numérica pela quadratura de Gauss-Legendre,
+    simples (m=1) ou composta em m painéis iguais".
+
+    Parâmetros:
+    funcao: Função a ser integrada;
+    a (float): Limite inferior de integração;
+    b (float): Limite superior de integração;
+    ordem (int): Número de nós de Gauss em cada painel (a regra é exata para polinômios de grau 2*ordem - 1);
+    m (int): Número de painéis;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre todos os nós;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    record_points (str): Como os pontos avaliados são registrados: "full" (guardados),
+    "lazy" (regenerados apenas se forem acessados) ou "off" (descartados).
+
+    Retorna: "(IntegralReal) Objeto representando o resultado da computação."
+    """
+
+    _, w = _nos_pesos_gauss(ordem)
+    X = _nos_gauss(a, b, ordem, m)
+    Y = _avaliar(funcao, X, vetorizar)
+    s = _somar(Y.reshape(m, ordem) @ w, soma)*(b - a)/(2*m)
+    p = _registrar_pontos(
+        record_points,
+        lambda: np.column_stack((X, Y)),
+        partial(_pontos, funcao, partial(_nos_gauss, a, b, ordem, m), vetorizar),
+    )
+    return IntegralReal(funcao, float(s), p, a, b, m, "gauss", avaliacoes=m*ordem)
+
+
+def integral_cumulativa(funcao, a, b, n=1000, vetorizar=True, soma="pareada",
+                        record_points="lazy") -> IntegralCumulativa:
+    """
+    Objetivos: - "Essa função calcula, em uma única passada, a integral acumulada
+    F(x) = ∫_a^x f em todos os nós de uma malha uniforme, pelo método de Simpson".
+
+    Parâmetros:
+    funcao: Função a ser integrada;
+    a (float): Limite inferior de integração;
+    b (float): Maior valor de x para o qual F será calculada;
+    n (int): Número de subdivisões da malha;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre todos os nós;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    record_points (str): Como os pontos avaliados são registrados: "full" (guardados),
+    "lazy" (regenerados apenas se forem acessados) ou "off" (descartados).
+
+    Retorna: "(IntegralCumulativa) Objeto que responde F(x) para qualquer x entre a e b
+    (também se a > b); seu valor é a integral de a até b."
+    """
+
+    dx = (b-a)/n
+    X = np.linspace(a, b, 2*n + 1)      # Nós da malha intercalados com os pontos médios
+    Y = _avaliar(funcao, X, vetorizar)
+    F = np.empty(n + 1)
+    F[0] = 0
+    F[1:] = _acumular((Y[:-1:2] + 4*Y[1::2] + Y[2::2])*(dx/6), soma)
+    p = _registrar_pontos(
+        record_points,
+        lambda: np.column_stack((X, Y)),
+        partial(_pontos, funcao, partial(np.linspace, a, b, 2*n + 1), vetorizar),
+    )
+    return IntegralCumulativa(funcao, X[::2].copy(), F, Y[::2].copy(), p, "simpson")
+
+
+def _nos_tanh_sinh(a, b, t):
+    """
+    Mapeia os parâmetros t da regra tanh-sinh em nós x de [a, b] (limites possivelmente infinitos).
+
+    Parâmetros:
+    a, b (float): Limites de integração (podem ser -np.inf ou np.inf);
+    t (np.ndarray): Parâmetros t dos nós.
+
+    Retorna: "(tuple) Arrays com os nós x e os pesos (sem o fator do passo h)."
+    """
+    s = np.pi/2*np.sinh(t)
+    u = np.tanh(s)
+    c_m = 2/(1 + np.exp(2*s))       # 1 - u, sem cancelamento perto de u = 1
+    c_p = 2/(1 + np.exp(-2*s))      # 1 + u, sem cancelamento perto de u = -1
+    du = np.pi/2*np.cosh(t)*c_m*c_p
+    if np.isfinite(a) and np.isfinite(b):
+        L = (b - a)/2
+        x = np.where(u < 0, a + L*c_p, b - L*c_m)       # Mede a distância a partir do extremo mais próximo
+        dx = L
+    elif np.isfinite(a):
+        x = a + c_p/c_m
+        dx = 2/c_m**2
+    elif np.isfinite(b):
+        x = b - c_m/c_p
+        dx = 2/c_p**2
+    else:
+        x = u/(c_m*c_p)
+        dx = (1 + u**2)/(c_m*c_p)**2
+    return x, du*dx
+
+
+def integral_tanh_sinh(funcao, a, b, tol=1e-12, max_niveis=10, t_max=4.0, vetorizar=True,
+                       soma="pareada", record_points="lazy") -> IntegralReal:
+    """
+    Objetivos: - "Essa função calcula integrais impróprias (limites infinitos ou singularidades
+    nos extremos) pela quadratura tanh-sinh (dupla exponencial)".
+
+    A substituição x = φ(t) concentra os nós perto dos extremos, com pesos que decaem
+    duplamente exponencialmente, e os limites infinitos são levados a um intervalo finito.
+    A cada nível o passo h é dividido pela metade, avaliando apenas os novos nós.
+    A função nunca é avaliada exatamente nos extremos.
+
+    Parâmetros:
+    funcao: Função a ser integrada;
+    a (float): Limite inferior de integração (pode ser -np.inf);
+    b (float): Limite superior de integração (pode ser np.inf);
+    tol (float): Tolerância para a diferença entre as aproximações de dois níveis consecutivos;
+    max_niveis (int): Número máximo de vezes que o passo é dividido pela metade;
+    t_max (float): Os nós usam t em [-t_max, t_max];
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre os novos nós de cada nível;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    record_points (str): Como os pontos avaliados são registrados: "full" (guardados),
+    "lazy" (recalculados apenas se forem acessados) ou "off" (descartados).
+
+    Retorna: "(IntegralReal) Objeto representando o resultado da computação,
+    com a estimativa de erro e o número de avaliações da função."
+    """
+
+    if a == b:
+        return IntegralReal(funcao, 0.0, None, a, b, 0, "tanh_sinh", 0.0, 0)
+    if a > b:
+        integral = integral_tanh_sinh(funcao, b, a, tol, max_niveis, t_max, vetorizar, soma, record_points)
+        integral.valor, integral.min, integral.max = -integral.valor, a, b
+        return integral
+
+    acumulado, avaliacoes, erro, valor = 0.0, 0, np.inf, np.nan
+    avaliados = []
+    for nivel in range(max_niveis + 1):
+        h = 2.0**-nivel
+        k = np.arange(1, int(t_max/h) + 1)
+        if nivel > 0:
+            k = k[k % 2 == 1]               # Apenas os nós novos
+        t = h*np.concatenate((-k[::-1], [0], k) if nivel == 0 else (-k[::-1], k))
+        x, w = _nos_tanh_sinh(a, b, t)
+        dentro = (x > a) & (x < b) & (w > 0) & np.isfinite(w)   # Descarta nós que coincidem com os extremos
+        x, w = x[dentro], w[dentro]
+        y = _avaliar(funcao, x, vetorizar)
+        avaliacoes += len(x)
+        if record_points == "full":
+            avaliados.append(np.column_stack((x, y)))
+        acumulado += _somar(w*y, soma)
+        novo = h*acumulado
+        if nivel > 0:
+            erro = abs(novo - valor)
+        valor = novo
+        if erro <= tol:
+            break
+
+    def pontos_avaliados():
+        P = np.concatenate(avaliados)
+        return P[np.argsort(P[:, 0])]
+
+    p = _registrar_pontos(
+        record_points,
+        pontos_avaliados,
+        lambda: integral_tanh_sinh(funcao, a, b, tol, max_niveis, t_max, vetorizar, soma, "full").pontos,
+    )
+    return IntegralReal(funcao, float(valor), p, a, b, None, "tanh_sinh", float(erro), avaliacoes)
+
+
+def _nos_pesos_lote(regra, n):
+    """
+    Retorna os nós em [0, 1] e os pesos (para um intervalo de comprimento 1) da regra usada em integral_lote.
+    """
+    if regra == "trap":
+        T = np.linspace(0, 1, n + 1)
+        w = np.full(n + 1, 1/n)
+        w[[0, -1]] = 1/(2*n)
+    elif regra == "simpson":
+        T = np.linspace(0, 1, 2*n + 1)
+        w = np.where(np.arange(2*n + 1) % 2 == 1, 4.0, 2.0)/(6*n)
+        w[[0, -1]] = 1/(6*n)
+    elif regra == "gauss":
+        t, pesos = _nos_pesos_gauss(n)
+        T, w = (t + 1)/2, pesos/2
+    else:
+        raise ValueError("Regra inválida!")
+    return T, w
+
+
+def integral_lote(funcao, a, b, n=1000, parametros=None, regra="simpson", vetorizar=True, bloco=1_000_000,
+                  soma="pareada", retornar_integrais=False):
+    """
+    Objetivos: - "Essa função calcula de uma só vez várias integrais: a mesma função em vários
+    intervalos [a_i, b_i] e/ou uma família de funções f(x, p_i) com parâmetros p_i".
+
+    Todos os nós são montados em uma única malha 2D (uma linha por integral) e a função é
+    chamada uma só vez por bloco de linhas.
+
+    Parâmetros:
+    funcao: Função a ser integrada, chamada como funcao(x) ou, se houver parâmetros, funcao(x, p);
+    a (float ou array): Limite(s) inferior(es) de integração;
+    b (float ou array): Limite(s) superior(es) de integração;
+    n (int): Número de subdivisões (nas regras "trap" e "simpson") ou de nós (na regra "gauss");
+    parametros (array ou None): Valores do parâmetro p de cada integral;
+    regra (str): "trap", "simpson" ou "gauss";
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre cada bloco da malha;
+    bloco (int): Número máximo de nós avaliados de uma só vez (limita o uso de memória);
+    soma (str): Como os valores de cada integral são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    retornar_integrais (bool): Se também deve retornar uma IntegralReal para cada integral.
+
+    Retorna: "(np.ndarray) Array com o valor de cada integral" e, se retornar_integrais for True,
+    também uma lista de IntegralReal.
+    """
+
+    _somar(np.zeros(0), soma)      # Valida o modo de soma antes de avaliar a função
+    T, w = _nos_pesos_lote(regra, n)
+    if parametros is None:
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        P = None
+    else:
+        a, b, P = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float), np.asarray(parametros))
+    forma = a.shape
+    a, b = a.ravel(), b.ravel()
+    P = None if P is None else P.ravel()
+
+    valores = np.empty(len(a))
+    linhas = max(bloco//len(T), 1)
+    for inicio in range(0, len(a), linhas):
+        fatia = slice(inicio, inicio + linhas)
+        L = b[fatia] - a[fatia]
+        X = a[fatia, None] + L[:, None]*T          # Uma linha de nós por integral
+        if P is None:
+            coordenadas = (X.ravel(),)
+        else:
+            coordenadas = (X.ravel(), np.repeat(P[fatia], len(T)))
+        Y = _avaliar_coordenadas(funcao, coordenadas, vetorizar).reshape(X.shape)
+        if soma == "pareada":
+            valores[fatia] = (Y @ w)*L
+        else:
+            valores[fatia] = np.fromiter((_somar(linha, soma) for linha in Y*w), dtype=float, count=len(Y))*L
+
+    valores = valores.reshape(forma)
+    if not retornar_integrais:
+        return valores
+
+    integrais = []
+    for i, valor in enumerate(valores.ravel()):
+        f = funcao if P is None else partial(_com_parametro, funcao, P[i])
+        nos = partial(_nos_lote, float(a[i]), float(b[i]), T)
+        integrais.append(IntegralReal(f, float(valor), partial(_pontos, f, nos, vetorizar), a[i], b[i], n, regra))
+    return valores, integrais
+
+
+def _nos_lote(a, b, T):
+    """
+    Nós de uma integral de integral_lote, calculados só quando os pontos são acessados
+    (cada integral guarda apenas a, b e uma referência aos nós T compartilhados).
+    """
+    return a + (b - a)*T
+
+
+def _com_parametro(funcao, p, x):
+    """
+    Avalia funcao(x, p): fixa o parâmetro de uma integral de integral_lote.
+    """
+    return funcao(x, p)
+
+
+def _validar_dados(x, y):
+    """
+    Confere os dados tabelados (x, y) e os converte em arrays de floats, sem copiá-los se já forem.
+
+    Retorna: "(tuple) Arrays x e y."
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.ndim != 1 or x.shape != y.shape:
+        raise ValueError("Os dados x e y devem ser unidimensionais e ter o mesmo tamanho")
+    if len(x) < 2:
+        raise ValueError("São necessários pelo menos dois pontos")
+    if np.any(x[1:] <= x[:-1]):
+        raise ValueError("As coordenadas x devem ser estritamente crescentes")
+    return x, y
+
+
+def integral_trap_dados(x, y, soma="pareada", record_points="lazy") -> IntegralReal:
+    """
+    Objetivos: - "Essa função calcula a integral de dados tabelados (x, y), possivelmente
+    com espaçamento não uniforme, pelo método dos trapézios".
+
+    Parâmetros:
+    x (array): Coordenadas x, estritamente crescentes;
+    y (array): Valores da função em cada x;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    record_points (str): Como os pontos são registrados: "full" (copiados para o resultado),
+    "lazy" (montados a partir de x e y apenas se forem acessados) ou "off" (descartados).
+
+    Retorna: "(IntegralReal) Objeto representando o resultado da computação.
+    A função associada é a interpolação linear dos dados."
+    """
+
+    x, y = _validar_dados(x, y)
+    s = _somar(np.diff(x)*(y[1:] + y[:-1]), soma)/2
+    pontos = lambda: np.column_stack((x, y))
+    p = _registrar_pontos(record_points, pontos, pontos)
+    return IntegralReal(partial(np.interp, xp=x, fp=y), float(s), p, x[0], x[-1], len(x) - 1, "trap_dados")
+
+
+def integral_simpson_dados(x, y, soma="pareada", record_points="lazy") -> IntegralReal:
+    """
+    Objetivos: - "Essa função calcula a integral de dados tabelados (x, y), possivelmente
+    com espaçamento não uniforme, pelo método de Simpson".
+
+    Em cada par de intervalos consecutivos a função é aproximada pela parábola que passa pelos
+    seus três pontos. Se o número de intervalos for ímpar, o último intervalo usa a parábola
+    que passa pelos três últimos pontos.
+
+    Parâmetros:
+    x (array): Coordenadas x, estritamente crescentes;
+    y (array): Valores da função em cada x;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    record_points (str): Como os pontos são registrados: "full" (copiados para o resultado),
+    "lazy" (montados a partir de x e y apenas se forem acessados) ou "off" (descartados).
+
+    Retorna: "(IntegralReal) Objeto representando o resultado da computação.
+    A função associada é a interpolação linear dos dados."
+    """
+
+    x, y = _validar_dados(x, y)
+    if len(x) == 2:
+        return integral_trap_dados(x, y, soma, record_points)
+
+    h = np.diff(x)
+    m = len(h)//2                       # Número de pares de intervalos
+    h0, h1 = h[0:2*m:2], h[1:2*m:2]
+    y0, y1, y2 = y[0:2*m:2], y[1:2*m + 1:2], y[2:2*m + 1:2]
+    termos = (h0 + h1)/6*((2 - h1/h0)*y0 + (h0 + h1)**2/(h0*h1)*y1 + (2 - h0/h1)*y2)
+    s = _somar(termos, soma)
+    if len(h) % 2 == 1:
+        # Último intervalo: integral da parábola pelos três últimos pontos
+        h0, h1 = h[-2], h[-1]
+        alfa = (2*h1**2 + 3*h0*h1)/(6*(h0 + h1))
+        beta = (h1**2 + 3*h0*h1)/(6*h0)
+        eta = h1**3/(6*h0*(h0 + h1))
+        s += alfa*y[-1] + beta*y[-2] - eta*y[-3]
+
+    pontos = lambda: np.column_stack((x, y))
+    p = _registrar_pontos(record_points, pontos, pontos)
+    return IntegralReal(partial(np.interp, xp=x, fp=y), float(s), p, x[0], x[-1], len(x) - 1, "simpson_dados")
+
+
+def integral_cumulativa_dados(x, y, soma="pareada"):
+    """
+    Objetivos: - "Essa função calcula a integral acumulada F(x_i) = ∫_{x_0}^{x_i} f de dados
+    tabelados (x, y) pelo método dos trapézios".
+
+    Parâmetros:
+    x (array): Coordenadas x, estritamente crescentes;
+    y (array): Valores da função em cada x;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo).
+
+    Retorna: "(np.ndarray) Array com o valor da integral acumulada em cada x (começando em 0)."
+    """
+
+    x, y = _validar_dados(x, y)
+    F = np.empty_like(y)
+    F[0] = 0
+    F[1:] = _acumular(np.diff(x)*(y[1:] + y[:-1])/2, soma)
+    return F
+
+
+def _combinar_momentos(n_a, media_a, m2_a, n_b, media_b, m2_b):
+    """
+    Combina as estatísticas (tamanho, média e soma dos quadrados dos desvios) de duas
+    amostras, sem precisar guardá-las (atualização de Welford/Chan).
+
+    Retorna: "(tuple) Tamanho, média e soma dos quadrados dos desvios da amostra combinada."
+    """
+    n = n_a + n_b
+    delta = media_b - media_a
+    media = media_a + delta*n_b/n
+    m2 = m2_a + m2_b + delta**2*n_a*n_b/n
+    return n, media, m2
+
+
+def _semente_filha(semente, i):
+    """
+    Retorna a i-ésima semente filha de uma SeedSequence, equivalente a semente.spawn(i + 1)[i],
+    mas sem alterar a semente original (para que o sorteio possa ser repetido).
+    """
+    return np.random.SeedSequence(semente.entropy, spawn_key=semente.spawn_key + (i,))
+
+
+def _amostras_monteCarlo(funcao, a, b, c, d, tamanho, semente, vetorizar=True):
+    """
+    Sorteia e avalia um bloco de amostras do método de Monte Carlo.
+
+    Parâmetros:
+    funcao: Função a ser integrada;
+    a, b, c, d (float): Limites do retângulo [a, b] x [c, d];
+    tamanho (int): Número de amostras do bloco;
+    semente (np.random.SeedSequence): Semente própria do bloco;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre o bloco.
+
+    Retorna: "(tuple) Arrays x, y e f(x, y)."
+    """
+    gerador = np.random.default_rng(semente)
+    x = gerador.uniform(a, b, tamanho)
+    y = gerador.uniform(c, d, tamanho)
+    return x, y, _avaliar_coordenadas(funcao, (x, y), vetorizar)
+
+
+def _blocos_monteCarlo(a, b, c, d, n, semente, bloco):
+    """
+    Divide as n amostras do método de Monte Carlo em blocos de tamanho fixo, cada um com
+    a sua própria semente. Assim, as amostras só dependem da semente e do tamanho do bloco,
+    e não da ordem (ou do processo) em que os blocos são executados.
+
+    Retorna: "(list[tuple]) Argumentos (a, b, c, d, tamanho, semente) de cada bloco."
+    """
+    return [
+        (a, b, c, d, min(bloco, n - inicio), _semente_filha(semente, i))
+        for i, inicio in enumerate(range(0, n, bloco))
+    ]
+
+
+def _momentos_monteCarlo(funcao, a, b, c, d, tamanho, semente, vetorizar=True, registrar=False, soma="pareada"):
+    """
+    Processa um bloco de amostras do método de Monte Carlo, devolvendo apenas as suas estatísticas.
+
+    Retorna: "(tuple) Tamanho, média e soma dos quadrados dos desvios do bloco, além das
+    amostras (linhas (x, y, f(x, y))) se registrar for True."
+    """
+    x, y, z = _amostras_monteCarlo(funcao, a, b, c, d, tamanho, semente, vetorizar)
+    media = _somar(z, soma)/len(z)
+    return len(z), media, _somar((z - media)**2, soma), np.column_stack((x, y, z)) if registrar else None
+
+
+def _pontos_monteCarlo(funcao, a, b, c, d, n, semente, bloco, vetorizar=True):
+    """
+    Regenera as amostras do método de Monte Carlo como um array de formato (n, 3), com linhas (x, y, f(x, y)).
+    """
+    return np.concatenate([
+        np.column_stack(_amostras_monteCarlo(funcao, *args, vetorizar))
+        for args in _blocos_monteCarlo(a, b, c, d, n, semente, bloco)
+    ])
+
+
+def monteCarlo(funcao, a, b, c, d, n=1000, semente=None, tol=None, bloco=100_000, vetorizar=True, soma="pareada",
+               executor=None, workers=None, record_points="lazy") -> IntegralNumerica:
     """
     Objetivos: - "Essa função calcula a integral numérica de uma função f : R² -> R pelo método de Monte Carlo."
 
@@ -309,20 +1301,303 @@ def monteCarlo(funcao, a, b, c, d, n=1000) -> IntegralNumerica:
     b (float): Limite superior de integração na 1ª dimensão;
     c (float): Limite inferior de integração na 2ª dimensão;
     d (float): Limite superior de integração na 2ª dimensão;
-    n (int): Número de repetições do experimento.
+    n (int): Número (máximo) de repetições do experimento;
+    semente (int ou None): Semente do gerador de números aleatórios, para resultados reprodutíveis;
+    tol (float ou None): Se dado, interrompe o experimento assim que o erro padrão fica abaixo de tol;
+    bloco (int): Número de amostras sorteadas e avaliadas de uma só vez (limita o uso de memória);
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre cada bloco de amostras;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    executor (concurrent.futures.Executor ou None): Pool onde os blocos são processados em paralelo;
+    workers (int ou None): Se não houver executor, número de processos usados. Com processos, a
+    função deve poder ser serializada (definida no nível de um módulo, não uma lambda);
+    record_points (str): Como as amostras são registradas: "full" (guardadas),
+    "lazy" (regeneradas a partir da semente apenas se forem acessadas) ou "off" (descartadas).
+
+    Retorna: "(IntegralNumerica) Objeto representando o resultado da computação, com o erro padrão
+    da estimativa e o número de amostras usadas." Os pontos são um array com linhas (x, y, f(x, y)).
+    O resultado é o mesmo para qualquer número de workers.
+    """
 
-    Retorna: "(IntegralNumerica) Objeto representando o resultado da computação."
+    semente = np.random.SeedSequence(semente)   # Permite regenerar exatamente as mesmas amostras
+    area = (b-a)*(d-c)
+    cont, media, m2 = 0, 0.0, 0.0               # Apenas somas acumuladas: memória constante
+    erro = np.inf
+    p = []
+    argumentos = [
+        (funcao, *args, vetorizar, record_points == "full", soma)
+        for args in _blocos_monteCarlo(a, b, c, d, n, semente, bloco)
+    ]
+    # Os blocos são combinados sempre na mesma ordem, qualquer que seja o paralelismo
+    for n_bloco, media_bloco, m2_bloco, amostras in _mapear(_momentos_monteCarlo, argumentos, executor, workers):
+        cont, media, m2 = _combinar_momentos(cont, media, m2, n_bloco, media_bloco, m2_bloco)
+        if amostras is not None:
+            p.append(amostras)
+        if cont > 1:
+            erro = area*np.sqrt(m2/(cont - 1)/cont)
+            if tol is not None and erro <= tol:
+                break
+    p = _registrar_pontos(
+        record_points,
+        lambda: np.concatenate(p),
+        partial(_pontos_monteCarlo, funcao, a, b, c, d, cont, semente, bloco, vetorizar),
+    )
+    return IntegralNumerica(funcao, float(media*area), p, float(erro), cont)
+
+
+def _divisoes_estratos(n, d, aproveitamento=0.9):
+    """
+    Escolhe a grade de estratos do método "estratificado": o número de divisões de cada eixo
+    (iguais ou diferindo de 1 entre os eixos) e quantos pares de amostras ficam em cada estrato.
+
+    A grade é refinada um eixo por vez enquanto houver ao menos um par por estrato, e é escolhida
+    a mais fina que ainda usa pelo menos 'aproveitamento' das n avaliações. Em dimensão alta,
+    onde não cabem duas divisões por eixo, os eixos restantes ficam sem divisão e os estratos
+    recebem vários pares.
+
+    Retorna: "(tuple) Tupla com as divisões de cada eixo e o número de pares por estrato."
+    """
+    pares = max(n//2, 1)
+    divisoes = [1]*d
+    escolhida, estratos = tuple(divisoes), 1
+    while True:
+        eixo = int(np.argmin(divisoes))
+        estratos = estratos//divisoes[eixo]*(divisoes[eixo] + 1)
+        if estratos > pares:
+            break
+        divisoes[eixo] += 1
+        if estratos*(pares//estratos) >= aproveitamento*pares:
+            escolhida = tuple(divisoes)
+    return escolhida, pares//math.prod(escolhida)
+
+
+def _blocos_nd(funcao, limites, n, metodo, semente, bloco, replicas, vetorizar=True):
+    """
+    Sorteia as amostras do método de Monte Carlo n-dimensional em blocos, sempre iguais
+    para uma mesma semente.
+
+    Parâmetros:
+    funcao: Função a ser integrada, chamada como funcao(x1, x2, ..., xd);
+    limites (np.ndarray): Array (d, 2) com os limites de cada dimensão;
+    n (int): Número (aproximado) de avaliações da função;
+    metodo (str): "uniforme", "antitetico", "estratificado", "sobol" ou "halton";
+    semente (np.random.SeedSequence): Semente do gerador de números aleatórios;
+    bloco (int): Número máximo de amostras por bloco;
+    replicas (int): Número de sequências de baixa discrepância embaralhadas independentes;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre cada bloco.
+
+    Retorna: Gerador de tuplas (X, Y, r): amostras (k, d), valores da função e o índice da réplica.
+    Nos métodos "antitetico" e "estratificado" cada bloco tem duas metades pareadas:
+    a amostra i da primeira metade e a amostra i da segunda formam um par (ou um estrato).
+    """
+    d = len(limites)
+    gerador = np.random.default_rng(semente)
+    metade = max(bloco//2, 1)
+
+    def avaliar(U, r=0):
+        X = limites[:, 0] + U*(limites[:, 1] - limites[:, 0])
+        return X, _avaliar_coordenadas(funcao, tuple(X.T), vetorizar), r
+
+    if metodo == "uniforme":
+        for inicio in range(0, n, bloco):
+            yield avaliar(gerador.random((min(bloco, n - inicio), d)))
+
+    elif metodo == "antitetico":
+        pares = n//2
+        for inicio in range(0, pares, metade):
+            U = gerador.random((min(metade, pares - inicio), d))
+            yield avaliar(np.concatenate((U, 1 - U)))
+
+    elif metodo == "estratificado":
+        divisoes, pares = _divisoes_estratos(n, d)
+        estratos = math.prod(divisoes)
+        for inicio in range(0, estratos*pares, metade):
+            indices = np.arange(inicio, min(inicio + metade, estratos*pares)) % estratos
+            base = np.column_stack(np.unravel_index(indices, divisoes))
+            U1 = (base + gerador.random(base.shape))/divisoes
+            U2 = (base + gerador.random(base.shape))/divisoes
+            yield avaliar(np.concatenate((U1, U2)))
+
+    elif metodo in ("sobol", "halton"):
+        for r in range(replicas):
+            rng = np.random.default_rng(_semente_filha(semente, r))
+            if metodo == "sobol":
+                # Sobol mantém suas propriedades apenas para potências de 2
+                total = 2**int(np.log2(max(n//replicas, 1)))
+                passo = min(2**int(np.log2(max(bloco, 1))), total)
+                sequencia = qmc.Sobol(d, scramble=True, rng=rng)
+            else:
+                total = max(n//replicas, 1)
+                passo = bloco
+                sequencia = qmc.Halton(d, scramble=True, rng=rng)
+            for inicio in range(0, total, passo):
+                yield avaliar(sequencia.random(min(passo, total - inicio)), r)
+
+    else:
+        raise ValueError("Método inválido!")
+
+
+def _pontos_nd(funcao, limites, n, metodo, semente, bloco, replicas, vetorizar=True):
+    """
+    Regenera as amostras do método de Monte Carlo n-dimensional como um array (N, d + 1),
+    com linhas (x1, ..., xd, f(x1, ..., xd)).
+    """
+    return np.concatenate([
+        np.column_stack((X, Y)) for X, Y, _ in _blocos_nd(funcao, limites, n, metodo, semente, bloco, replicas, vetorizar)
+    ])
+
+
+def monteCarlo_nd(funcao, limites, n=10_000, metodo="estratificado", semente=None, bloco=100_000, replicas=8,
+                  vetorizar=True, soma="pareada", record_points="lazy") -> IntegralNumerica:
+    """
+    Objetivos: - "Essa função calcula a integral numérica de uma função f : R^d -> R em um
+    hiper-retângulo pelo método de Monte Carlo, com técnicas de redução de variância".
+
+    Parâmetros:
+    funcao: Função a ser integrada, chamada como funcao(x1, x2, ..., xd);
+    limites (list[tuple]): Limites (inferior, superior) de integração em cada dimensão;
+    n (int): Número (aproximado) de avaliações da função;
+    metodo (str): Como as amostras são sorteadas:
+        "uniforme" - amostragem uniforme simples;
+        "antitetico" - pares de amostras u e 1 - u (variáveis antitéticas);
+        "estratificado" - uma grade de estratos iguais, com o mesmo número de pares de amostras
+        em cada estrato (em dimensão alta, só parte dos eixos é dividida);
+        "sobol" ou "halton" - sequências de baixa discrepância embaralhadas (quasi-Monte Carlo);
+    semente (int ou None): Semente do gerador de números aleatórios, para resultados reprodutíveis;
+    bloco (int): Número de amostras sorteadas e avaliadas de uma só vez (limita o uso de memória);
+    replicas (int): Nos métodos "sobol" e "halton", número de sequências independentes
+    usadas para estimar o erro;
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre cada bloco de amostras;
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    record_points (str): Como as amostras são registradas: "full" (guardadas),
+    "lazy" (regeneradas a partir da semente apenas se forem acessadas) ou "off" (descartadas).
+
+    Retorna: "(IntegralNumerica) Objeto representando o resultado da computação, com o erro padrão
+    da estimativa e o número de avaliações da função." Os pontos são um array com linhas (x1, ..., xd, f).
     """
 
-    s = 0
+    limites = np.array(limites, dtype=float).reshape(-1, 2)
+    volume = np.prod(limites[:, 1] - limites[:, 0])
+    semente = np.random.SeedSequence(semente)
+    avaliacoes = 0
+    cont, media, m2 = 0, 0.0, 0.0           # Estatísticas das unidades independentes (amostras ou pares)
+    soma_var = 0.0                          # Estratificado: soma das variâncias das médias dos estratos
+    somas, contagens = np.zeros(replicas), np.zeros(replicas)     # Quasi-Monte Carlo: uma média por réplica
     p = []
-    for i in range(n):
-        x = random.uniform(a, b)       
-        y = random.uniform(c, d)
-        s += funcao(x, y)
-        p.append(((x, y), funcao(x, y)))
-    media = s/n
-    return IntegralNumerica(funcao, media*(b-a)*(d-c), p)
+    for X, Y, r in _blocos_nd(funcao, limites, n, metodo, semente, bloco, replicas, vetorizar):
+        avaliacoes += len(Y)
+        if record_points == "full":
+            p.append(np.column_stack((X, Y)))
+        if metodo in ("sobol", "halton"):
+            somas[r] += _somar(Y, soma)
+            contagens[r] += len(Y)
+            continue
+        if metodo in ("antitetico", "estratificado"):
+            h = len(Y)//2
+            if metodo == "estratificado":
+                soma_var += _somar((Y[:h] - Y[h:])**2, soma)/4
+            Y = (Y[:h] + Y[h:])/2       # Média de cada par (ou de cada estrato)
+        media_bloco = _somar(Y, soma)/len(Y)
+        cont, media, m2 = _combinar_momentos(cont, media, m2, len(Y), media_bloco, _somar((Y - media_bloco)**2, soma))
+
+    if metodo in ("sobol", "halton"):
+        medias = somas/contagens
+        media = np.mean(medias)
+        erro = volume*np.std(medias, ddof=1)/np.sqrt(replicas) if replicas > 1 else np.inf
+    elif metodo == "estratificado":
+        erro = volume*np.sqrt(soma_var)/cont
+    else:
+        erro = volume*np.sqrt(m2/(cont - 1)/cont) if cont > 1 else np.inf
+
+    p = _registrar_pontos(
+        record_points,
+        lambda: np.concatenate(p),
+        partial(_pontos_nd, funcao, limites, n, metodo, semente, bloco, replicas, vetorizar),
+    )
+    return IntegralNumerica(funcao, float(media*volume), p, float(erro), avaliacoes)
+
+
+def _malha_multipla(limites, T, w, linhas, vetorizar=True):
+    """
+    Monta, para um bloco de índices da primeira variável, a malha produto dos nós da regra
+    e o peso de cada ponto (já multiplicado pelos comprimentos dos intervalos internos).
+
+    Parâmetros:
+    limites (list[tuple]): Limites de integração; os limites da variável k podem ser funções
+    das variáveis anteriores, chamadas como limite(x1, ..., xk);
+    T, w (np.ndarray): Nós em [0, 1] e pesos da regra unidimensional;
+    linhas (slice): Índices dos nós da primeira variável incluídos no bloco;
+    vetorizar (bool): Se os limites variáveis devem ser avaliados de uma só vez sobre a malha.
+
+    Retorna: "(tuple) Lista com um array de coordenadas por variável e o array de pesos."
+    """
+    a, b = (float(lim) for lim in limites[0])
+    coordenadas = [a + (b - a)*T[linhas]]
+    W = (b - a)*w[linhas]
+    for inferior, superior in limites[1:]:
+        forma = W.shape
+        achatadas = tuple(np.broadcast_to(C, forma).ravel() for C in coordenadas)
+        lo, hi = (
+            _avaliar_coordenadas(lim, achatadas, vetorizar).reshape(forma) if callable(lim) else np.full(forma, float(lim))
+            for lim in (inferior, superior)
+        )
+        coordenadas = [C[..., None] for C in coordenadas]
+        coordenadas.append(lo[..., None] + (hi - lo)[..., None]*T)
+        W = W[..., None]*(hi - lo)[..., None]*w
+    formato = W.shape
+    return [np.broadcast_to(C, formato).ravel() for C in coordenadas], W.ravel()
+
+
+def integral_multipla(funcao, limites, n=20, regra="gauss", vetorizar=True, bloco=1_000_000, soma="pareada",
+                      record_points="lazy") -> IntegralNumerica:
+    """
+    Objetivos: - "Essa função calcula integrais duplas, triplas (ou em qualquer dimensão) por
+    cubatura determinística: o produto tensorial de uma regra unidimensional".
+
+    Os limites de cada variável podem depender das variáveis anteriores (integração iterada),
+    como em ∫_a^b ∫_{g(x)}^{h(x)} f(x, y) dy dx. A malha é avaliada em blocos de nós da
+    primeira variável, com no máximo (aproximadamente) `bloco` pontos de cada vez.
+
+    Parâmetros:
+    funcao: Função a ser integrada, chamada como funcao(x1, x2, ..., xd);
+    limites (list[tuple]): Limites (inferior, superior) de cada variável, da mais externa para a
+    mais interna. Os da primeira são números; os das demais podem ser números ou funções das
+    variáveis anteriores, chamadas como limite(x1, ..., xk);
+    n (int): Número de subdivisões (nas regras "trap" e "simpson") ou de nós (na regra "gauss")
+    em cada dimensão;
+    regra (str): "trap", "simpson" ou "gauss";
+    vetorizar (bool): Se a função deve ser avaliada de uma só vez sobre cada bloco da malha;
+    bloco (int): Número máximo de pontos avaliados de uma só vez (limita o uso de memória);
+    soma (str): Como os valores são acumulados: "pareada" (soma em pares do NumPy) ou
+    "compensada" (somas em pares com TwoSum e combinação de Neumaier, com erro de arredondamento mínimo);
+    record_points (str): Como os pontos avaliados são registrados: "full" (guardados),
+    "lazy" (recalculados apenas se forem acessados) ou "off" (descartados).
+
+    Retorna: "(IntegralNumerica) Objeto representando o resultado da computação, com o número
+    de avaliações da função." Os pontos são um array com linhas (x1, ..., xd, f).
+    """
+
+    limites = list(limites)
+    if len(limites) == 0:
+        raise ValueError("É necessário pelo menos um par de limites")
+    T, w = _nos_pesos_lote(regra, n)
+    linhas = max(bloco//len(T)**(len(limites) - 1), 1)
+
+    parciais, avaliados = [], []
+    for inicio in range(0, len(T), linhas):
+        coordenadas, W = _malha_multipla(limites, T, w, slice(inicio, inicio + linhas), vetorizar)
+        Y = _avaliar_coordenadas(funcao, tuple(coordenadas), vetorizar)
+        parciais.append(_somar(W*Y, soma))
+        if record_points == "full":
+            avaliados.append(np.column_stack(coordenadas + [Y]))
+
+    p = _registrar_pontos(
+        record_points,
+        lambda: np.concatenate(avaliados),
+        lambda: integral_multipla(funcao, limites, n, regra, vetorizar, bloco, soma, "full").pontos,
+    )
+    return IntegralNumerica(funcao, float(_somar(np.array(parciais), soma)), p, avaliacoes=len(T)**len(limites))
 
 
 def plot_monteCarlo(f, a, b, c, d, n=1000, salvar_como=None) -> IntegralNumerica:
@@ -340,7 +1615,7 @@ def plot_monteCarlo(f, a, b, c, d, n=1000, salvar_como=None) -> IntegralNumerica
 
     Retorna: "(IntegralNumerica) Objeto representando o resultado da computação."
     """
-    integral = monteCarlo(f, a, b, c, d, n)
+    integral = monteCarlo(f, a, b, c, d, n, record_points="full")
     fig, ax = plt.subplots()
     ax.set_xlabel('Componente X')
     ax.set_ylabel('Componente Y')
@@ -348,8 +1623,7 @@ def plot_monteCarlo(f, a, b, c, d, n=1000, salvar_como=None) -> IntegralNumerica
 
     ax.plot([a, a, b, b, a], [c, d, d, c, c], color='black', zorder=0)
 
-    pxy, pz = zip(*integral.pontos)
-    px, py = zip(*pxy)
+    px, py, pz = integral.pontos.T
     sc = ax.scatter(px, py, c=pz, cmap='viridis', zorder=1)
     fig.colorbar(sc, label='Valor da função')
 
@@ -1,8 +1,91 @@
 import numpy as np
 import math
+from functools import lru_cache
 import matplotlib.pyplot as plt
 from typing import List
-from .utils import InterpBase
+from scipy.linalg import solve_banded
+try:
+    from .utils import InterpBase, Interval, Polynomial
+except ImportError:
+    from utils import InterpBase, Interval, Polynomial
+
+
+def _derivada_newton(coeficientes, nos, x_desejado, ordem=1):
+    """
+    Avalia a derivada de ordem 'ordem' de um polinômio na forma de Newton
+    por Horner generalizado, sobre todas as coordenadas de uma só vez.
+
+    Se P(x) = c_i + (x - x_i) Q(x), então P^(k)/k! = Q^(k-1)/(k-1)! + (x - x_i) Q^(k)/k!:
+    guardando d[k] = P^(k)/k! para k = 0, ..., ordem, cada coeficiente atualiza
+    todas as ordens, do maior para o menor.
+
+    Parâmetros:
+    coeficientes (np.ndarray): Coeficientes c_i da forma de Newton;
+    nos (np.ndarray): Nós x_i da forma de Newton;
+    x_desejado (float ou list): Coordenada(s) onde a derivada é avaliada;
+    ordem (int): Ordem da derivada (0 é o próprio polinômio).
+
+    Retorna: Um Array com os valores da derivada (ou um float, se x_desejado for um único número).
+    """
+    if ordem < 0:
+        raise ValueError('A ordem da derivada deve ser um inteiro não negativo.')
+    escalar = np.ndim(x_desejado) == 0
+    x_desejado = np.asarray(x_desejado, dtype=float)
+
+    d = np.zeros((ordem + 1,) + x_desejado.shape)
+    d[0] = coeficientes[-1]
+    for i in range(len(coeficientes) - 2, -1, -1):
+        diferenca = x_desejado - nos[i]
+        for k in range(min(ordem, len(coeficientes) - 1 - i), 0, -1):
+            d[k] = d[k-1] + diferenca * d[k]
+        d[0] = coeficientes[i] + diferenca * d[0]
+
+    valores = math.factorial(ordem) * d[ordem]
+    if escalar:
+        return valores.item()
+    return valores
+
+
+@lru_cache(maxsize=64)
+def _nos_pesos_gauss(ordem):
+    """
+    Calcula (uma única vez por ordem) os nós e pesos de Gauss-Legendre em [-1, 1].
+
+    Parâmetros:
+    ordem (int): Número de nós da regra.
+
+    Retorna: "(tuple) Arrays (somente leitura) com os nós e os pesos."
+    """
+    t, w = np.polynomial.legendre.leggauss(ordem)
+    t.setflags(write=False)     # Os arrays são compartilhados entre chamadas pelo cache
+    w.setflags(write=False)
+    return t, w
+
+
+def _integral_polinomio(avaliar, grau, a, b):
+    """
+    Integra exatamente um polinômio de grau 'grau' de a até b pela quadratura de
+    Gauss-Legendre com grau//2 + 1 nós (exata até o grau 2m - 1), avaliando o
+    polinômio sobre todos os nós de todos os intervalos de uma só vez.
+
+    Parâmetros:
+    avaliar (function): Avalia o polinômio em um array de qualquer formato;
+    grau (int): Grau do polinômio;
+    a, b (float ou list): Limites de integração (com broadcast entre si).
+
+    Retorna: A(s) integral(is) (um float, se a e b forem números).
+    """
+    t, w = _nos_pesos_gauss(grau // 2 + 1)
+    escalar = np.ndim(a) == 0 and np.ndim(b) == 0
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    meio, raio = (a + b) / 2, (b - a) / 2
+
+    valores = np.asarray(avaliar(meio[..., None] + raio[..., None] * t))
+    integrais = np.tensordot(valores, w, axes=([a.ndim], [0]))
+    integrais = integrais * raio.reshape(raio.shape + (1,) * (integrais.ndim - raio.ndim))
+    if escalar and integrais.ndim == 0:
+        return integrais.item()
+    return integrais
 
 class Poly_Interp(InterpBase):
     '''
@@ -24,6 +107,7 @@ class Poly_Interp(InterpBase):
       super().__init__(x, y)
 
       self.coeficientes = None
+      self.diagonal = None
       self.calcular_coef()
 
     def calcular_coef(self):
@@ -31,58 +115,157 @@ class Poly_Interp(InterpBase):
       Esta função calcula os coeficientes do polinômio interpolador
       utilizando o método de Newton (diferenças divididas) e atualizando
       o objeto da classe 'self.coeficientes'.
+
+      A tabela não é montada: um único vetor é atualizado no lugar, uma
+      ordem de diferenças por vez (O(n) de memória). Após a ordem j, a
+      posição i guarda f[x_{i-j}, ..., x_i] e as j primeiras já são os
+      coeficientes finais.
+
+      Também guarda em 'self.diagonal' a última diagonal da tabela,
+      diagonal[j] = f[x_{n-1-j}, ..., x_{n-1}], usada por add_point().
       """
-      tabela = np.zeros((self.n, self.n))
-      tabela[:,0] = self.y
+      coef = np.array(self.y, dtype=float)
+      diagonal = np.empty(self.n)
+      diagonal[0] = coef[-1]
 
       for j in range(1, self.n):
-          for i in range(self.n - j):
-              numerador = tabela[i+1, j-1] - tabela[i, j-1]
-              denominador = self.x[i+j] - self.x[i]
-              if denominador == 0:
-                  raise ZeroDivisionError('Há dois pontos com a mesma coordenada x.')
-              tabela[i, j] = numerador / denominador
-      self.coeficientes = tabela[0,:]
+          denominador = self.x[j:] - self.x[:-j]
+          if np.any(denominador == 0):
+              raise ZeroDivisionError('Há dois pontos com a mesma coordenada x.')
+          coef[j:] = (coef[j:] - coef[j-1:-1]) / denominador
+          diagonal[j] = coef[-1]
+      self.coeficientes = coef
+      self.diagonal = diagonal
+
+    def add_point(self, x_novo, y_novo):
+      """
+      Esta função acrescenta um ponto ao polinômio interpolador em O(n),
+      sem recalcular a tabela de diferenças divididas: só a nova diagonal
+      é calculada, a partir da diagonal guardada, e ela fornece o novo
+      coeficiente.
+
+      Os pontos acrescentados ficam no fim de 'self.x' e 'self.y' (a ordem
+      dos nós na forma de Newton), que deixam de estar necessariamente
+      ordenados; o domínio passa a ser [min(x), max(x)].
+
+      Parâmetros:
+      x_novo (float): Coordenada x do novo ponto;
+      y_novo (float): Coordenada y do novo ponto.
+      """
+      if np.any(self.x == x_novo):
+          raise ZeroDivisionError('Há dois pontos com a mesma coordenada x.')
+
+      # f[x_{n-k}, ..., x_novo] = (f[x_{n-k+1}, ..., x_novo] - f[x_{n-k}, ..., x_{n-1}]) / (x_novo - x_{n-k})
+      # Recorrência sequencial: floats do Python evitam o custo dos escalares do NumPy
+      anterior, nos = self.diagonal.tolist(), self.x[::-1].tolist()
+      valor, x_float = float(y_novo), float(x_novo)
+      diagonal = [valor]
+      for d, x_k in zip(anterior, nos):
+          valor = (valor - d) / (x_float - x_k)
+          diagonal.append(valor)
+
+      self.x = np.append(self.x, x_novo)
+      self.y = np.append(self.y, y_novo)
+      self.n += 1
+      self.coeficientes = np.append(self.coeficientes, diagonal[-1])
+      self.diagonal = np.array(diagonal)
+      self.domain = Interval(min(self.domain.min, x_novo), max(self.domain.max, x_novo))
+
+    def extend(self, x_novos, y_novos):
+      """
+      Esta função acrescenta vários pontos, um de cada vez, com add_point().
 
-    def __call__(self, x_desejado):
+      Parâmetros:
+      x_novos (list): Coordenadas x dos novos pontos;
+      y_novos (list): Coordenadas y dos novos pontos.
+      """
+      if len(x_novos) != len(y_novos):
+          raise TypeError("Ambos os conjuntos devem possuir mesma cardinalidade (tamanho)")
+      for x_novo, y_novo in zip(x_novos, y_novos):
+          self.add_point(x_novo, y_novo)
+
+    def __call__(self, x_desejado, out=None):
         """
         Esta função permite a classe ser chamada como o
         polinômio interpolador, retornando seu valor no
         x desejado.
 
+        O polinômio é avaliado pelo método de Horner na forma de Newton,
+        com o laço sobre o grau e todas as coordenadas de uma só vez.
+
         Parâmetros:
         x_desejado (float, int ou list): Coordenada(s) x('s) que
-        queremos avaliar.
+        queremos avaliar;
+        out (np.ndarray ou None): Array de floats com o formato de x_desejado
+        onde os valores são escritos, evitando alocar o resultado.
 
-        Retorna: Um Array com os valores do polinômio interpolador.
+        Retorna: Um Array com os valores do polinômio interpolador
+        (ou um float, se x_desejado for um único número).
 
         """
-        # Transforma a entrada em Numpy Array
-        x_desejado = np.atleast_1d(x_desejado)
+        escalar = np.ndim(x_desejado) == 0 and out is None
+        x_desejado = np.asarray(x_desejado, dtype=float)
 
-        def func_valor(x_val):
-          """
-          Esta função calcula o valor do polinômio interpolador
-          para um dado x pelo método de Horner.
+        if out is None:
+            out = np.empty(x_desejado.shape)
+        elif out.shape != x_desejado.shape:
+            raise ValueError('O array de saída deve ter o mesmo formato das coordenadas.')
 
-          Parâmetros:
-          x_val (float): coordenada x.
+        # Horner: p = c_0 + (x - x_0)(c_1 + (x - x_1)(c_2 + ...))
+        diferenca = np.empty(x_desejado.shape)
+        out[...] = self.coeficientes[self.n - 1]
+        for i in range(self.n - 2, -1, -1):
+            np.subtract(x_desejado, self.x[i], out=diferenca)
+            out *= diferenca
+            out += self.coeficientes[i]
 
-          Retorna: Um float com o valor de x no polinômio interpolador.
+        # Se for somente um ponto, passa o Array para um float
+        if escalar:
+            return out.item()
+        return out
 
-          """
-          resultado = self.coeficientes[self.n - 1]
-          for i in range(self.n - 2, -1, -1):
-              resultado = self.coeficientes[i] + (x_val - self.x[i]) * resultado
-          return resultado
 
-        valores = np.array([func_valor(x_val) for x_val in x_desejado])
+    def derivada(self, x_desejado, ordem=1):
+        """
+        Esta função calcula a derivada analítica do polinômio interpolador,
+        diretamente dos coeficientes da forma de Newton.
 
-        # Se for somente um ponto, passa o Array para um float ou int
-        if isinstance(x_desejado, (int, float)):
-            return valores.item()
-        return valores
+        Parâmetros:
+        x_desejado (float, int ou list): Coordenada(s) x('s) que
+        queremos avaliar;
+        ordem (int): Ordem da derivada.
 
+        Retorna: Um Array com os valores da derivada (ou um float, se
+        x_desejado for um único número).
+        """
+        return _derivada_newton(self.coeficientes, self.x, x_desejado, ordem)
+
+    def integral(self, a, b):
+        """
+        Esta função calcula a integral exata do polinômio interpolador de a até b.
+
+        Parâmetros:
+        a, b (float ou list): Limites de integração.
+
+        Retorna: A(s) integral(is) (um float, se a e b forem números).
+        """
+        return _integral_polinomio(self, self.n - 1, a, b)
+
+    def polinomio(self, base="monomial", intervalo=None):
+        """
+        Esta função converte o polinômio interpolador da forma de Newton para
+        um Polynomial, na base monomial ou de Chebyshev.
+
+        Parâmetros:
+        base (str): "monomial" ou "chebyshev";
+        intervalo (tuple ou None): Intervalo da base de Chebyshev (por padrão,
+        o domínio da interpolação).
+
+        Retorna: Um Polynomial.
+        """
+        if intervalo is None:
+            intervalo = (self.domain.min, self.domain.max)
+        return Polynomial.de_newton(self.coeficientes, self.x, base, intervalo)
 
     def erro(self, func_original, pontos):
         """
@@ -122,53 +305,333 @@ class Poly_Interp(InterpBase):
 
     
 
+class Barycentric_Interp(InterpBase):
+    '''
+      Classe que cria o polinômio interpolador na forma baricêntrica de Lagrange,
+      numericamente estável mesmo em grau alto. Os pesos dependem só dos nós:
+      são calculados uma vez (O(n^2), ou em forma fechada para nós de Chebyshev)
+      e cada avaliação custa O(n) por ponto, vetorizada sobre todos os pontos.
+
+      Args:
+          x: lista que representa as coordenadas x's dos pontos.
+          y: lista que representa as coordenadas y's dos pontos; pode ser um
+             array (n, k) com k conjuntos de dados na mesma malha.
+          pesos: None (calculados a partir dos nós), "chebyshev1" ou "chebyshev2"
+             (forma fechada para nós de Chebyshev de primeira ou segunda espécie)
+             ou um array com os pesos já calculados (por exemplo, os de outro
+             interpolador com os mesmos nós).
+
+      Return:
+          Quando somente inicializada, retorna:
+          calcular_pesos(): calcula os pesos baricêntricos.
+          grafico(): retorna um gráfico do polinômio interpolador e os pontos dados.
+    '''
+
+    # Número máximo de elementos da matriz (pontos x nós) montada de uma só vez
+    _bloco = 1_000_000
+
+    def __init__(self, x:list, y:list, pesos=None):
+        super().__init__(x, y)
+        self._ordem = np.argsort(x)
+        self.x = self.x.astype(float)
+        self.y = self.y.astype(float)
+
+        if np.any(np.diff(self.x) == 0):
+            raise ZeroDivisionError('Há dois pontos com a mesma coordenada x.')
+
+        self.pesos = None
+        self.calcular_pesos(pesos)
+
+    @staticmethod
+    def nos_chebyshev(a, b, n, especie=2):
+        """
+        Esta função gera n nós de Chebyshev no intervalo [a, b].
+
+        Parâmetros:
+        a, b (float): Extremos do intervalo;
+        n (int): Número de nós;
+        especie (int): 1 para as raízes de T_n, 2 para os extremos de T_{n-1}
+        (que incluem a e b).
+
+        Retorna: Um Array crescente com os nós.
+        """
+        if especie == 1:
+            t = np.cos((2*np.arange(n) + 1) * np.pi / (2*n))
+        elif especie == 2:
+            t = np.cos(np.arange(n) * np.pi / (n - 1)) if n > 1 else np.zeros(1)
+        else:
+            raise ValueError('A espécie dos nós de Chebyshev deve ser 1 ou 2.')
+        return (a + b)/2 + (b - a)/2 * t[::-1]
+
+    def calcular_pesos(self, pesos=None):
+        """
+        Esta função calcula os pesos baricêntricos w_j = 1/prod_{k != j}(x_j - x_k)
+        e atualiza 'self.pesos'. Os pesos só são definidos a menos de um fator
+        comum, que se cancela na fórmula baricêntrica.
+
+        Parâmetros:
+        pesos: None, "chebyshev1", "chebyshev2" ou um array com os pesos.
+        """
+        j = np.arange(self.n)
+        if pesos is None:
+            # Acumula log|produto| e o sinal separadamente para evitar overflow/underflow
+            log_produto = np.zeros(self.n)
+            negativos = np.zeros(self.n, dtype=bool)
+            for k in range(self.n):
+                diferenca = self.x - self.x[k]
+                diferenca[k] = 1.0
+                log_produto += np.log(np.abs(diferenca))
+                negativos ^= diferenca < 0
+            self.pesos = np.where(negativos, -1.0, 1.0) * np.exp(log_produto.min() - log_produto)
+        elif isinstance(pesos, str):
+            sinal = (-1.0) ** j
+            if pesos == "chebyshev1":
+                self.pesos = sinal * np.sin((2*j + 1) * np.pi / (2*self.n))
+            elif pesos == "chebyshev2":
+                self.pesos = sinal
+                self.pesos[[0, -1]] /= 2
+            else:
+                raise ValueError('Tipo de pesos inválido!')
+        else:
+            pesos = np.asarray(pesos, dtype=float)
+            if pesos.shape != (self.n,):
+                raise TypeError('Deve haver um peso para cada nó.')
+            self.pesos = pesos.copy()
+
+    def atualizar_y(self, y):
+        """
+        Esta função troca os valores y mantendo os nós e os pesos, em O(n).
+
+        Parâmetros:
+        y (list): Novos valores, na mesma ordem dos x's originais;
+        pode ser um array (n, k) com k conjuntos de dados.
+        """
+        y = np.asarray(y, dtype=float)
+        if len(y) != self.n:
+            raise TypeError("Ambos os conjuntos devem possuir mesma cardinalidade (tamanho)")
+        self.y = y[self._ordem]
+
+    def __call__(self, x_desejado):
+        """
+        Esta função permite a classe ser chamada como o
+        polinômio interpolador, pela fórmula baricêntrica
+
+            p(x) = sum_j w_j y_j/(x - x_j) / sum_j w_j/(x - x_j),
+
+        com p(x_j) = y_j exatamente nos nós.
+
+        Parâmetros:
+        x_desejado (float, int ou list): Coordenada(s) x('s) que
+        queremos avaliar.
+
+        Retorna: Um Array com os valores do polinômio interpolador (com uma
+        coluna a mais por conjunto de dados, se y for 2D), ou um float se
+        x_desejado for um único número e y for 1D.
+
+        """
+        return self._avaliar(x_desejado, self.y)
+
+    def _avaliar(self, x_desejado, y):
+        """
+        Avalia pela fórmula baricêntrica o polinômio que vale y nos nós.
+        """
+        escalar = np.ndim(x_desejado) == 0 and y.ndim == 1
+        x_desejado = np.asarray(x_desejado, dtype=float)
+        X = x_desejado.ravel()
+        valores = np.empty((len(X),) + y.shape[1:])
+
+        passo = max(self._bloco // self.n, 1)
+        for inicio in range(0, len(X), passo):
+            fatia = slice(inicio, inicio + passo)
+            diferenca = X[fatia, None] - self.x
+            with np.errstate(divide='ignore', invalid='ignore'):
+                C = self.pesos / diferenca
+                denominador = C.sum(axis=1).reshape((-1,) + (1,)*(y.ndim - 1))
+                valores[fatia] = (C @ y) / denominador
+            # Nos nós a fórmula dá inf/inf: usa o valor conhecido
+            linha, coluna = np.nonzero(diferenca == 0)
+            valores[inicio + linha] = y[coluna]
+
+        valores = valores.reshape(x_desejado.shape + y.shape[1:])
+        if escalar:
+            return valores.item()
+        return valores
+
+    def derivada(self, x_desejado, ordem=1):
+        """
+        Esta função calcula a derivada analítica do polinômio interpolador.
+        A derivada de um polinômio de grau n-1 é interpolada exatamente nos
+        mesmos nós, com os mesmos pesos: seus valores nos nós são D @ y, com a
+        matriz de diferenciação D_ij = (w_j/w_i)/(x_i - x_j), D_ii = -sum_{j != i} D_ij
+        (aplicada 'ordem' vezes, montada em blocos de linhas).
+
+        Parâmetros:
+        x_desejado (float, int ou list): Coordenada(s) x('s) que
+        queremos avaliar;
+        ordem (int): Ordem da derivada.
+
+        Retorna: Um Array com os valores da derivada (com uma coluna a mais
+        por conjunto de dados, se y for 2D), ou um float.
+        """
+        if ordem < 0:
+            raise ValueError('A ordem da derivada deve ser um inteiro não negativo.')
+        valores = self.y
+        passo = max(self._bloco // self.n, 1)
+        for _ in range(min(ordem, self.n)):
+            novos = np.empty(valores.shape)
+            for inicio in range(0, self.n, passo):
+                linhas = np.arange(inicio, min(inicio + passo, self.n))
+                with np.errstate(divide='ignore'):
+                    D = (self.pesos / self.pesos[linhas, None]) / (self.x[linhas, None] - self.x)
+                D[np.arange(len(linhas)), linhas] = 0.0
+                D[np.arange(len(linhas)), linhas] = -D.sum(axis=1)
+                novos[linhas] = D @ valores
+            valores = novos
+        if ordem >= self.n:
+            valores = np.zeros_like(valores)
+        return self._avaliar(x_desejado, valores)
+
+    def integral(self, a, b):
+        """
+        Esta função calcula a integral exata do polinômio interpolador de a até b.
+
+        Parâmetros:
+        a, b (float ou list): Limites de integração.
+
+        Retorna: A(s) integral(is) (um float, se a e b forem números e y for 1D).
+        """
+        return _integral_polinomio(self, self.n - 1, a, b)
+
+    def __repr__(self):
+        '''
+        Retorna a representação do objeto
+        de Interpolação bem como os pesos baricêntricos.
+        '''
+        return f'Barycentric_Interp(Grau={self.n-1}) \n\tx={self.x}, \n\ty={self.y} \n\tPesos={self.pesos})'
+
+    def grafico(self):
+        ''' a partir de InterpBase.grafico(), cria um gráfico com o polinômio interpolador e os pontos dados.
+
+        Returns:
+            Mostra o gráfico do polinômio e os pontos de interpolação.
+        '''
+        return super().grafico()
+
+
 class Linear_Interp(InterpBase):
+    '''
+    Classe que cria uma interpolação linear por partes para um conjunto
+    discreto de pontos, obedecendo à seguinte fórmula
+    y = y_0 + [(y_1-y_0)/(x_1-x_0)].(x-x_0) em cada segmento.
+
+    As inclinações dos segmentos são calculadas uma única vez, e o segmento
+    de cada ponto é localizado por busca binária (np.searchsorted).
+    '''
+
     def __init__(self, x, y):
         super().__init__(x, y)
+        self.inclinacoes = None
+        self.calcular_inclinacoes()
+
+    def calcular_inclinacoes(self):
+        """
+        Calcula a inclinação (y_1-y_0)/(x_1-x_0) de cada segmento e atualiza
+        'self.inclinacoes'. Segmentos de comprimento zero (x repetidos) têm
+        inclinação 0, valendo o y do seu ponto inicial.
+        """
+        dx = np.diff(self.x).astype(float)
+        dy = np.diff(self.y).astype(float)
+        self.inclinacoes = np.divide(dy, dx, out=np.zeros_like(dy), where=dx != 0)
+        # Integral acumulada de x_0 até cada nó (áreas dos trapézios)
+        self.integrais_nos = np.concatenate(([0.0], np.cumsum(dx * (self.y[:-1] + self.y[1:]) / 2)))
 
     def __call__(self, x_desejado):
-        if np.isscalar(x_desejado):
-            return self._linear_interp_single(x_desejado)
-        return np.array([self._linear_interp_single(x) for x in x_desejado])
-    
-    def _linear_interp_single(self, x_est):
         '''
-        Essa função gera uma interpolação linear por partes
-        para um conjunto discreto de pontos, obedecendo à
-        seguinte fórmula y = y_0 + [(y_1-y_0)/(x_1-x_0)].(x-x_0)
+        Essa função avalia a interpolação linear por partes em todos os
+        pontos de uma só vez: o ponto (x,y) é obtido encontrando o segmento
+        de reta que liga (x_0,y_0) a (x_1,y_1) tal que x_0 <= x <= x_1.
 
-        Ou seja, o ponto (x,y) é obtido encontrando o valor
-        correspondente da ordenada y dados um ponto abscissa x
-        tal que este estaja no seguinto de reta que liga o ponto
-        (x_0,y_0) ao ponto (x_1,y_1)
+        Args:
+            x_desejado (float, int ou list) : ponto(s) a estimar
+        Returns:
+            y_est (float ou np.array) : ponto(s) estimado(s), NaN fora de [x_0, x_n]
+        '''
+        escalar = np.ndim(x_desejado) == 0
+        x_est = np.asarray(x_desejado, dtype=float)
+
+        # Primeiro segmento cujo extremo direito é >= x (em x repetidos, vale o primeiro y)
+        i = self._segmentos(x_est)
+        if self.n > 1:
+            y_est = self.y[i] + self.inclinacoes[i] * (x_est - self.x[i])
+        else:
+            y_est = np.full(x_est.shape, float(self.y[0]))
+
+        ## A maneira de tratar extrapolação aqui é retornar NaN.
+        y_est = np.where((x_est < self.x[0]) | (x_est > self.x[-1]), np.nan, y_est)
+
+        if escalar:
+            return y_est.item()
+        return y_est
+
+    def _segmentos(self, x_est):
+        '''
+        Localiza o segmento de cada ponto (o mesmo critério de __call__).
+        '''
+        return np.clip(np.searchsorted(self.x, x_est, side='left') - 1, 0, max(self.n - 2, 0))
+
+    def derivada(self, x_desejado, ordem=1):
+        '''
+        Essa função calcula a derivada da interpolação linear por partes: a
+        inclinação do segmento de cada ponto (nos nós internos, a do segmento
+        à esquerda, como em __call__) e zero para ordens maiores que 1.
+
+        Args:
+            x_desejado (float, int ou list) : ponto(s) a avaliar
+            ordem (int) : ordem da derivada
+        Returns:
+            (float ou np.array) : derivada(s), NaN fora de [x_0, x_n]
+        '''
+        if ordem < 0:
+            raise ValueError('A ordem da derivada deve ser um inteiro não negativo.')
+        if ordem == 0:
+            return self(x_desejado)
+        escalar = np.ndim(x_desejado) == 0
+        x_est = np.asarray(x_desejado, dtype=float)
+
+        if ordem == 1 and self.n > 1:
+            valores = self.inclinacoes[self._segmentos(x_est)]
+        else:
+            valores = np.zeros(x_est.shape)
+        valores = np.where((x_est < self.x[0]) | (x_est > self.x[-1]), np.nan, valores)
+
+        if escalar:
+            return valores.item()
+        return valores
+
+    def integral(self, a, b):
+        '''
+        Essa função calcula a integral exata da interpolação linear por partes
+        de a até b, a partir das áreas acumuladas até os nós.
 
         Args:
-            self.x (np.array) : lista ordenada dos pontos da abscissa
-            self.y (np.array) : lista ordenada dos pontos da ordenada
-            x_est  (float) ou (int) : ponto a estimar
+            a, b (float ou list) : limites de integração
         Returns:
-            y_est (float) ou (int) : ponto estimado
+            (float ou np.array) : integral(is), NaN se algum limite estiver fora de [x_0, x_n]
         '''
-        if x_est<self.x[0] or x_est > self.x[-1]:
-           return  np.nan                       ## A maneira de tratar extrapolação aqui é retornar NaN.
-
-        for i in range(len(self.x)- 1):
-           if self.x[i] <= x_est <= self.x[i+1]:
-              x0,y0 = self.x[i], self.y[i]
-              x1,y1 = self.x[i+1], self.y[i+1]
-
-              if x1 == x0:
-                y_est = y0
-                return y_est
-
-              tg_theta = (y1-y0)/(x1-x0)
-              y_est = y0 + tg_theta * (x_est - x0)
-              return y_est
-            # Caso x_est seja exatamente o último ponto
-        if x_est == self.x[-1]:
-          return self.y[-1]
-
-        return None
+        escalar = np.ndim(a) == 0 and np.ndim(b) == 0
+
+        def primitiva(x_est):
+            x_est = np.asarray(x_est, dtype=float)
+            i = self._segmentos(x_est)
+            t = x_est - self.x[i]
+            inclinacao = self.inclinacoes[i] if self.n > 1 else 0.0
+            valores = self.integrais_nos[i] + t * (self.y[i] + inclinacao * t / 2)
+            return np.where((x_est < self.x[0]) | (x_est > self.x[-1]), np.nan, valores)
+
+        valores = primitiva(b) - primitiva(a)
+        if escalar:
+            return valores.item()
+        return valores
     
     def grafico(self, salvar_como = None):
         """
@@ -198,11 +661,12 @@ class Hermite_Interp(InterpBase):
         '''
         
         super().__init__(x_points, y_points)
-        self.dy = np.array(dy_points)
         if self.n != len(dy_points):
             raise TypeError('x, y e dy não possuem o mesmo tamanho')
+        # Mesma ordenação aplicada a x e y por InterpBase
+        self.dy = np.asarray(dy_points, dtype=float)[np.argsort(x_points)]
         self.coeficientes = None
-        self.tabela = None 
+        self.nos = None
         self.calcular_coef()
         
     def calcular_coef(self):
@@ -210,74 +674,89 @@ class Hermite_Interp(InterpBase):
         ''' Calcula os coeficientes do polinômio interpolador de Hermite usando 
         diferenças divididas.
 
-        A tabela de diferenças divididas é construída considerando que cada ponto x_i é repetido duas vezes para acomodar 
-        tanto o valor da função quanto o valor da derivada.   
+        Cada ponto x_i é repetido duas vezes (nós z_{2i} = z_{2i+1} = x_i) para acomodar 
+        tanto o valor da função quanto o valor da derivada: f[z_{2i}, z_{2i+1}] = dy_i.
+        A tabela não é montada: um único vetor de 2n posições é atualizado no lugar,
+        uma ordem de diferenças por vez, com operações do NumPy.
 
         Return:
-            Atualiza self.coeficientes com os coeficientes do polinômio de Hermite.
+            Atualiza self.coeficientes com os coeficientes do polinômio de Hermite
+            e self.nos com os nós repetidos.
         '''
 
-        self.tabela = np.zeros((2*self.n, 2*self.n))
-
-        for i in range(self.n):
-            self.tabela[2*i, 0] = self.y[i]
-            self.tabela[2*i + 1, 0] = self.y[i]
-            self.tabela[2*i, 1] = self.dy[i] 
+        x = self.x.astype(float)
+        if np.any(np.diff(x) == 0):
+            raise ZeroDivisionError('Há dois pontos com a mesma coordenada x.')
+        self.nos = np.repeat(x, 2)
 
-            print(self.tabela)
-            
-            if i < self.n - 1:
-                #diferença dividida do método de Newton para pontos distintos
-                self.tabela[2*i + 1, 1] = (self.y[i+1] - self.y[i]) / (self.x[i+1] - self.x[i])
-            else:
-                self.tabela[2*i + 1, 1] = self.dy[i]  
+        coef = np.repeat(self.y.astype(float), 2)
+        # Primeira ordem: derivadas nos nós repetidos e diferenças de Newton entre pontos distintos
+        coef[1::2] = self.dy
+        coef[2::2] = np.diff(self.y) / np.diff(x)
 
-        #adiciona os números na tabela
         for j in range(2, 2*self.n):
-            for i in range(2*self.n - j):
-                numerador = self.tabela[i + 1, j - 1] - self.tabela[i, j - 1]
-                denominador = self.x[(i + j) // 2] - self.x[i // 2]  
-                if denominador == 0:
-                    # Para pontos duplicados, usa a derivada
-                    self.tabela[i, j] = self.dy[i // 2] / math.factorial(j)
-                else:
-                    self.tabela[i, j] = numerador / denominador
-                    
+            coef[j:] = (coef[j:] - coef[j-1:-1]) / (self.nos[j:] - self.nos[:-j])
         
-        # a primeira linha da tabela contém os coeficientes do polinômio
-        self.coeficientes = self.tabela[0, :]
+        # as posições do vetor agora contêm os coeficientes do polinômio
+        self.coeficientes = coef
 
     def valor_polinomio(self, x_desejado):
 
-        ''' Avalia o polinômio interpolador de Hermite no ponto x_desejado.
+        ''' Avalia o polinômio interpolador de Hermite no ponto x_desejado
+        por multiplicação aninhada (Horner na forma de Newton), com o laço
+        sobre os coeficientes e todas as coordenadas de uma só vez.
         Args:
             x_desejado: valor ou array de valores onde o polinômio deve ser avaliado.
         Return:
             Valor do polinômio no(s) ponto(s) x_desejado.
         '''
 
+        escalar = np.ndim(x_desejado) == 0
+        x_desejado = np.asarray(x_desejado, dtype=float)
 
-        x_desejado = np.atleast_1d(x_desejado)
+        resultado = np.full(x_desejado.shape, self.coeficientes[-1])
+        for i in range(2*self.n - 2, -1, -1):
+            resultado *= x_desejado - self.nos[i]
+            resultado += self.coeficientes[i]
 
-        def evaluate_single_point(x_val):
+        if escalar:
+            return resultado.item()
+        return resultado
 
-            ''' Avalia o polinômio em um único ponto x_val. 
-             Args:
-                x_val: valor onde o polinômio deve ser avaliado.
-             Return:
-                Valor do polinômio no ponto x_val.
-            '''
-            
-            resultado = self.coeficientes[0]
-            produto = 1.0
-            
-            for i in range(1, 2*self.n):
-                produto *= (x_val - self.x[(i-1) // 2])  
-                resultado += self.coeficientes[i] * produto
-            
-            return resultado
+    def derivada(self, x_desejado, ordem=1):
 
-        return np.array([evaluate_single_point(x_val) for x_val in x_desejado])
+        ''' Calcula a derivada analítica do polinômio de Hermite, diretamente dos
+        coeficientes da forma de Newton (sem verificação de extrapolação).
+        Args:
+            x_desejado: valor ou array de valores onde a derivada deve ser avaliada.
+            ordem: ordem da derivada.
+        Return:
+            Valor da derivada no(s) ponto(s) x_desejado.
+        '''
+        return _derivada_newton(self.coeficientes, self.nos, x_desejado, ordem)
+
+    def integral(self, a, b):
+
+        ''' Calcula a integral exata do polinômio de Hermite de a até b.
+        Args:
+            a, b: limites de integração (números ou arrays).
+        Return:
+            A(s) integral(is).
+        '''
+        return _integral_polinomio(self.valor_polinomio, 2*self.n - 1, a, b)
+
+    def polinomio(self, base="monomial", intervalo=None):
+
+        ''' Converte o polinômio de Hermite da forma de Newton para um Polynomial.
+        Args:
+            base: "monomial" ou "chebyshev".
+            intervalo: intervalo da base de Chebyshev (por padrão, o domínio da interpolação).
+        Return:
+            Um Polynomial.
+        '''
+        if intervalo is None:
+            intervalo = (self.domain.min, self.domain.max)
+        return Polynomial.de_newton(self.coeficientes, self.nos, base, intervalo)
     
     
     def __call__(self, x_desejado):
@@ -308,6 +787,299 @@ class Hermite_Interp(InterpBase):
         return super().grafico()
 
 
+def _resolver_tridiagonal(inferior, diagonal, superior, d):
+    """
+    Resolve em O(n) um sistema tridiagonal, com a eliminação de Gauss do
+    LAPACK para matrizes de banda (a mesma varredura do algoritmo de Thomas,
+    compilada e com pivoteamento parcial).
+
+    Args:
+        inferior: subdiagonal (inferior[i] multiplica x_{i-1}; inferior[0] é ignorado).
+        diagonal: diagonal principal.
+        superior: superdiagonal (superior[i] multiplica x_{i+1}; superior[-1] é ignorado).
+        d: lado direito.
+    Return:
+        Array com a solução x.
+    """
+    banda = np.empty((3, len(diagonal)))
+    banda[0, 1:] = superior[:-1]
+    banda[1] = diagonal
+    banda[2, :-1] = inferior[1:]
+    return solve_banded((1, 1), banda, d, overwrite_ab=True, check_finite=False)
+
+
+class _Cubica_Por_Partes(InterpBase):
+    '''
+    Classe base para interpolações cúbicas por partes definidas pelos valores y
+    e pelas derivadas s nos nós. Os coeficientes de cada segmento,
+    p_i(x) = c0 + c1*t + c2*t^2 + c3*t^3 com t = x - x_i, ficam em um array
+    contíguo 'self.coeficientes' de formato (4, n-1).
+
+    As classes filhas implementam calcular_derivadas().
+    '''
+
+    def __init__(self, x, y):
+        super().__init__(x, y)
+        self.x = self.x.astype(float)
+        self.y = self.y.astype(float)
+        if self.n < 2:
+            raise TypeError('São necessários pelo menos dois pontos.')
+        if np.any(np.diff(self.x) == 0):
+            raise ZeroDivisionError('Há dois pontos com a mesma coordenada x.')
+
+        self.h = np.diff(self.x)
+        self.inclinacoes = np.diff(self.y) / self.h
+        self.coeficientes = None
+
+    def calcular_derivadas(self):
+        raise NotImplementedError("A classe filha implementa a calcular_derivadas")
+
+    def calcular_coef(self):
+        """
+        Calcula os coeficientes de cada segmento a partir dos valores e das
+        derivadas nos nós e atualiza 'self.coeficientes'.
+        """
+        s = self.calcular_derivadas()
+        h, m = self.h, self.inclinacoes
+        self.coeficientes = np.empty((4, self.n - 1))
+        self.coeficientes[0] = self.y[:-1]
+        self.coeficientes[1] = s[:-1]
+        self.coeficientes[2] = (3*m - 2*s[:-1] - s[1:]) / h
+        self.coeficientes[3] = (s[:-1] + s[1:] - 2*m) / h**2
+
+        # Integral acumulada de x_0 até cada nó
+        c = self.coeficientes
+        segmentos = h*(c[0] + h*(c[1]/2 + h*(c[2]/3 + h*c[3]/4)))
+        self.integrais_nos = np.concatenate(([0.0], np.cumsum(segmentos)))
+
+    def __call__(self, x_desejado):
+        """
+        Avalia a interpolação em todos os pontos de uma só vez: o segmento de
+        cada ponto é localizado por busca binária e o polinômio do segmento é
+        avaliado pelo método de Horner.
+
+        Parâmetros:
+        x_desejado (float, int ou list): Coordenada(s) x('s) que
+        queremos avaliar.
+
+        Retorna: Um Array com os valores (ou um float, se x_desejado for um
+        único número), NaN fora de [x_0, x_n].
+        """
+        return self.derivada(x_desejado, 0)
+
+    def derivada(self, x_desejado, ordem=1):
+        """
+        Avalia a derivada analítica de ordem 'ordem' (0 é a própria interpolação)
+        a partir dos coeficientes de cada segmento:
+        d^k/dx^k sum_j c_j t^j = sum_{j >= k} c_j j!/(j-k)! t^(j-k).
+
+        Parâmetros:
+        x_desejado (float, int ou list): Coordenada(s) x('s) que
+        queremos avaliar;
+        ordem (int): Ordem da derivada.
+
+        Retorna: Um Array com os valores (ou um float, se x_desejado for um
+        único número), NaN fora de [x_0, x_n].
+        """
+        if ordem < 0:
+            raise ValueError('A ordem da derivada deve ser um inteiro não negativo.')
+        escalar = np.ndim(x_desejado) == 0
+        x_desejado = np.asarray(x_desejado, dtype=float)
+
+        i = np.clip(np.searchsorted(self.x, x_desejado, side='right') - 1, 0, self.n - 2)
+        t = x_desejado - self.x[i]
+        valores = np.zeros(x_desejado.shape)
+        for j in range(3, ordem - 1, -1):
+            valores = valores*t + math.perm(j, ordem)*self.coeficientes[j, i]
+        valores = np.where((x_desejado < self.x[0]) | (x_desejado > self.x[-1]), np.nan, valores)
+
+        if escalar:
+            return valores.item()
+        return valores
+
+    def integral(self, a, b):
+        """
+        Calcula a integral exata da interpolação de a até b, a partir das
+        integrais acumuladas até os nós.
+
+        Parâmetros:
+        a, b (float ou list): Limites de integração.
+
+        Retorna: A(s) integral(is) (um float, se a e b forem números), NaN se
+        algum limite estiver fora de [x_0, x_n].
+        """
+        escalar = np.ndim(a) == 0 and np.ndim(b) == 0
+
+        def primitiva(x_desejado):
+            x_desejado = np.asarray(x_desejado, dtype=float)
+            i = np.clip(np.searchsorted(self.x, x_desejado, side='right') - 1, 0, self.n - 2)
+            t = x_desejado - self.x[i]
+            c = self.coeficientes[:, i]
+            valores = self.integrais_nos[i] + t*(c[0] + t*(c[1]/2 + t*(c[2]/3 + t*c[3]/4)))
+            return np.where((x_desejado < self.x[0]) | (x_desejado > self.x[-1]), np.nan, valores)
+
+        valores = primitiva(b) - primitiva(a)
+        if escalar:
+            return valores.item()
+        return valores
+
+    def grafico(self, salvar_como = None):
+        """
+        Cria um gráfico com a interpolação cúbica por partes e os pontos dados.
+        """
+        return super().grafico()
+
+
+class Spline_Interp(_Cubica_Por_Partes):
+    '''
+    Classe que cria um spline cúbico interpolador (C^2) a partir dos pontos dados.
+    As derivadas nos nós saem de um sistema tridiagonal, resolvido em O(n).
+
+    Args:
+        x: lista que representa as coordenadas x's dos pontos.
+        y: lista que representa as coordenadas y's dos pontos.
+        contorno: condição nas extremidades:
+            "natural" - segunda derivada nula nos extremos;
+            "fixo" - primeira derivada dada nos extremos (spline "clamped");
+            "not-a-knot" - terceira derivada contínua em x_1 e x_{n-2}.
+        derivadas: par (s_0, s_n) com as derivadas nos extremos, para contorno "fixo".
+    '''
+
+    def __init__(self, x, y, contorno="natural", derivadas=None):
+        super().__init__(x, y)
+        if contorno not in ("natural", "fixo", "not-a-knot"):
+            raise ValueError('Condição de contorno inválida!')
+        if contorno == "fixo" and derivadas is None:
+            raise ValueError('O contorno "fixo" precisa das derivadas nos extremos.')
+        self.contorno = contorno
+        self.derivadas = derivadas
+        self.calcular_coef()
+
+    def calcular_derivadas(self):
+        """
+        Monta e resolve o sistema tridiagonal da continuidade da segunda derivada,
+        h_i s_{i-1} + 2(h_{i-1} + h_i) s_i + h_{i-1} s_{i+1} = 3(h_i m_{i-1} + h_{i-1} m_i),
+        completado pelas duas equações da condição de contorno.
+
+        Return:
+            Array com as derivadas s nos nós.
+        """
+        h, m, n = self.h, self.inclinacoes, self.n
+
+        if self.contorno == "not-a-knot" and n <= 3:
+            # Com dois ou três pontos o not-a-knot é a reta ou a parábola que passa por eles
+            if n == 2:
+                return np.full(2, m[0])
+            c2 = (m[1] - m[0]) / (self.x[2] - self.x[0])
+            return m[0] + c2*(2*self.x - self.x[0] - self.x[1])
+
+        inferior = np.empty(n)
+        diagonal = np.empty(n)
+        superior = np.empty(n)
+        d = np.empty(n)
+        inferior[1:-1] = h[1:]
+        diagonal[1:-1] = 2*(h[:-1] + h[1:])
+        superior[1:-1] = h[:-1]
+        d[1:-1] = 3*(h[1:]*m[:-1] + h[:-1]*m[1:])
+
+        if self.contorno == "natural":
+            diagonal[0], superior[0], d[0] = 2, 1, 3*m[0]
+            inferior[-1], diagonal[-1], d[-1] = 1, 2, 3*m[-1]
+        elif self.contorno == "fixo":
+            diagonal[0], superior[0], d[0] = 1, 0, self.derivadas[0]
+            inferior[-1], diagonal[-1], d[-1] = 0, 1, self.derivadas[1]
+        else:
+            L = self.x[2] - self.x[0]
+            diagonal[0], superior[0] = h[1], L
+            d[0] = ((h[0] + 2*L)*h[1]*m[0] + h[0]**2*m[1]) / L
+            L = self.x[-1] - self.x[-3]
+            inferior[-1], diagonal[-1] = L, h[-2]
+            d[-1] = (h[-1]**2*m[-2] + (2*L + h[-1])*h[-2]*m[-1]) / L
+
+        return _resolver_tridiagonal(inferior, diagonal, superior, d)
+
+    def __repr__(self):
+        '''
+        Retorna a representação do objeto de Interpolação.
+        '''
+        return f'Spline_Interp(n={self.n}, contorno={self.contorno}) \n\tx={self.x}, \n\ty={self.y}'
+
+
+class Hermite_Cubico_Interp(_Cubica_Por_Partes):
+    '''
+    Classe que cria uma interpolação de Hermite cúbica por partes (C^1): em cada
+    segmento, a cúbica que tem os valores e as derivadas dados nos dois extremos.
+    Usa os mesmos dados de Hermite_Interp, mas com custo O(n) na construção e
+    O(log n) por ponto na avaliação, sem as oscilações do polinômio global.
+
+    Sem as derivadas, elas são estimadas pelo método PCHIP (Fritsch-Carlson),
+    que preserva a monotonicidade dos dados.
+
+    Args:
+        x_points: lista que representa as coordenadas x's dos pontos.
+        y_points: lista que representa as coordenadas y's dos pontos.
+        dy_points: lista que representa as derivadas nos pontos x's (opcional).
+    '''
+
+    def __init__(self, x_points:list, y_points:list, dy_points:list = None):
+        super().__init__(x_points, y_points)
+        if dy_points is None:
+            self.dy = None
+        else:
+            if self.n != len(dy_points):
+                raise TypeError('x, y e dy não possuem o mesmo tamanho')
+            self.dy = np.asarray(dy_points, dtype=float)[np.argsort(x_points)]
+        self.calcular_coef()
+
+    def calcular_derivadas(self):
+        """
+        Retorna as derivadas dadas ou, se não houver, as estimativas PCHIP:
+        nos nós internos, zero onde as inclinações dos segmentos vizinhos mudam
+        de sinal e, nos demais, sua média harmônica ponderada; nos extremos, a
+        fórmula de três pontos, limitada para manter a forma dos dados.
+
+        Return:
+            Array com as derivadas s nos nós.
+        """
+        if self.dy is not None:
+            return self.dy
+
+        h, m = self.h, self.inclinacoes
+        s = np.empty(self.n)
+        if self.n == 2:
+            s[:] = m[0]
+            return s
+
+        w1 = 2*h[1:] + h[:-1]
+        w2 = h[1:] + 2*h[:-1]
+        mesmo_sinal = m[:-1]*m[1:] > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            media = (w1 + w2) / (w1/m[:-1] + w2/m[1:])
+        s[1:-1] = np.where(mesmo_sinal, media, 0.0)
+        s[0] = self._derivada_extremo(h[0], h[1], m[0], m[1])
+        s[-1] = self._derivada_extremo(h[-1], h[-2], m[-1], m[-2])
+        return s
+
+    @staticmethod
+    def _derivada_extremo(h0, h1, m0, m1):
+        """
+        Fórmula de três pontos não centrada para a derivada em um extremo,
+        ajustada para preservar a forma (sem criar extremos locais).
+        """
+        d = ((2*h0 + h1)*m0 - h0*m1) / (h0 + h1)
+        if np.sign(d) != np.sign(m0):
+            return 0.0
+        if np.sign(m0) != np.sign(m1) and abs(d) > abs(3*m0):
+            return 3*m0
+        return d
+
+    def __repr__(self):
+        '''
+        Retorna a representação do objeto de Interpolação.
+        '''
+        return f'Hermite_Cubico_Interp(n={self.n}) \n\tx={self.x}, \n\ty={self.y} \n\tdy={self.dy}'
+
+
 if __name__ == "__main__":
     x_points = [1, 2, 3]
     y_points = [1, 4, 9]
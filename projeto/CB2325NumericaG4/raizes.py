@@ -8,7 +8,8 @@ def derivada(f, x, h=1e-6):
 
     """
     Função que calcula a primeira derivada de f(x) em um ponto x usando o
-    método de diferenças centrais.
+    método de diferenças centrais. Se f tiver derivada analítica (atributo
+    'prime', como os interpoladores), ela é usada no lugar da aproximação.
         
     Parâmetros: 
         f (função): função contínua;
@@ -18,6 +19,10 @@ def derivada(f, x, h=1e-6):
     Retorna: Valor aproximado da derivada de f(x) no ponto x (float).
     """
 
+    prime = getattr(f, 'prime', None)
+    if prime is not None:
+        return prime(x)
+
     return (f(x + h) - f(x - h)) / (2 * h)
 
 # Métodos numéricos para encontrar raízes de funções reais:
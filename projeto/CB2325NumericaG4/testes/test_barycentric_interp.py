@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from interpolacao import Barycentric_Interp, Poly_Interp
+
+@pytest.fixture
+def interp():
+    x = [3, 0, 1, 2]
+    y = [27, 0, 1, 8]
+    return Barycentric_Interp(x, y)
+
+def test_pontos_conhecidos(interp):
+    assert interp(0) == 0
+    assert interp(2) == 8
+    assert isinstance(interp(3), float)
+
+def test_interpolacao_vetor(interp):
+    pontos = np.array([[0.5, 1.5], [2.5, 4.0]])
+    assert np.allclose(interp(pontos), pontos**3)
+
+def test_igual_a_newton():
+    x = np.sort(np.random.default_rng(0).uniform(-2, 2, 10))
+    y = np.sin(x)
+    pontos = np.linspace(-2, 2, 101)
+    assert np.allclose(Barycentric_Interp(x, y)(pontos), Poly_Interp(x, y)(pontos))
+
+@pytest.mark.parametrize("especie", [1, 2])
+def test_pesos_chebyshev(especie):
+    x = Barycentric_Interp.nos_chebyshev(-1, 1, 30, especie)
+    geral = Barycentric_Interp(x, np.exp(x))
+    fechado = Barycentric_Interp(x, np.exp(x), f"chebyshev{especie}")
+    assert np.allclose(geral.pesos/geral.pesos[0], fechado.pesos/fechado.pesos[0])
+    pontos = np.linspace(-1, 1, 50)
+    assert np.allclose(fechado(pontos), np.exp(pontos), atol=1e-14)
+
+def test_grau_alto_estavel():
+    x = Barycentric_Interp.nos_chebyshev(-1, 1, 1000)
+    runge = lambda t: 1/(1 + 25*t**2)
+    interp = Barycentric_Interp(x, runge(x))
+    pontos = np.linspace(-1, 1, 1001)
+    assert np.all(np.isfinite(interp.pesos))
+    assert np.allclose(interp(pontos), runge(pontos), atol=1e-12)
+
+def test_atualizar_y_e_varios_conjuntos(interp):
+    interp.atualizar_y([9, 0, 1, 4])
+    assert np.allclose(interp([0.5, 2.5]), [0.25, 6.25])
+    x = [3, 0, 1, 2]
+    conjuntos = Barycentric_Interp(x, np.column_stack([x, np.square(x)]), pesos=interp.pesos)
+    assert conjuntos(1.5).shape == (2,)
+    assert np.allclose(conjuntos([1.5, 2.5]), [[1.5, 2.25], [2.5, 6.25]])
+
+def test_erros():
+    with pytest.raises(ZeroDivisionError):
+        Barycentric_Interp([0, 1, 1], [0, 1, 2])
+    with pytest.raises(ValueError):
+        Barycentric_Interp([0, 1], [0, 1], "legendre")
+    with pytest.raises(TypeError):
+        Barycentric_Interp([0, 1], [0, 1], [1.0])
+
+def test_derivada_e_integral(interp):
+    pontos = np.array([0.5, 1.5, 2.5])
+    assert np.allclose(interp.derivada(pontos), 3*pontos**2)
+    assert np.allclose(interp.derivada(pontos, 3), 6)
+    assert np.allclose(interp.derivada(pontos, 4), 0)
+    assert interp.integral(0, 2) == pytest.approx(4)
+    assert interp.prime is not None and interp.prime_safe(1.0) == pytest.approx(3)
@@ -0,0 +1,67 @@
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from interpolacao import Hermite_Cubico_Interp
+
+
+@pytest.fixture
+def interp():
+    x = [0, 1, 3, 4, 6]
+    y = [0, 1, 9, 16, 36]
+    dy = [0, 2, 6, 8, 12]
+    return Hermite_Cubico_Interp(x, y, dy)
+
+
+def test_pontos_conhecidos(interp):
+    assert interp(0) == pytest.approx(0)
+    assert interp(3) == pytest.approx(9)
+    assert interp(6) == pytest.approx(36)
+
+
+def test_reproduz_quadratica_com_derivadas(interp):
+    pontos = np.linspace(0, 6, 25)
+    assert np.allclose(interp(pontos), pontos**2)
+
+
+def test_derivadas_fora_de_ordem():
+    interp = Hermite_Cubico_Interp([2, 0, 1], [8, 0, 1], [12, 0, 3])
+    c, h = interp.coeficientes, interp.h
+    assert np.allclose(c[1], [0, 3])
+    assert c[1, -1] + 2*c[2, -1]*h[-1] + 3*c[3, -1]*h[-1]**2 == pytest.approx(12)
+
+
+def test_pchip_preserva_monotonicidade():
+    x = [0, 1, 2, 3, 4, 5]
+    y = [0, 0, 0.1, 5, 5.1, 5.1]
+    interp = Hermite_Cubico_Interp(x, y)
+    assert interp.dy is None
+    valores = interp(np.linspace(0, 5, 501))
+    assert np.all(np.diff(valores) >= -1e-12)
+    assert valores.min() >= 0 and valores.max() <= 5.1 + 1e-12
+
+
+def test_dominio_e_tamanhos(interp):
+    assert np.isnan(interp(-1.0)) and np.isnan(interp(7.0))
+    with pytest.raises(TypeError):
+        Hermite_Cubico_Interp([0, 1, 2], [0, 1, 4], [0, 2])
+
+
+def test_grafico(interp, monkeypatch):
+    figuras = []
+    monkeypatch.setattr(plt, "show", lambda: figuras.append(plt.gcf()))
+    interp.grafico()
+    assert len(figuras) == 1
+    curva = figuras[0].axes[0].get_lines()[0]
+    X, Y = curva.get_xdata(), curva.get_ydata()
+    assert X[0] == 0 and X[-1] == 6
+    assert np.allclose(Y, interp(X))
+    plt.close(figuras[0])
+
+
+def test_derivada_e_integral(interp):
+    assert np.allclose(interp.derivada([0, 1, 3, 4, 6]), [0, 2, 6, 8, 12])
+    assert interp.derivada(2.0, 2) == pytest.approx(2)
+    assert interp.integral(0, 6) == pytest.approx(72)
+    assert interp.integral(6, 0) == pytest.approx(-72)
@@ -59,4 +59,30 @@ def test_interpolacao_lista(interp):
     pontos = [0, 1, 3, 6]
     esperado = np.array([0, 1, 9, 36])
     resultado = interp(pontos)
-    assert np.allclose(resultado, esperado)
\ No newline at end of file
+    assert np.allclose(resultado, esperado)
+
+
+def test_derivadas_fora_de_ordem():
+    interp = Hermite_Interp([3, 1, 2], [27, 1, 8], [27, 3, 12])
+    pontos = np.linspace(1, 3, 9)
+    assert np.allclose(interp(pontos), pontos**3)
+
+
+def test_construcao_silenciosa_e_vetorizada(capsys):
+    x = np.linspace(0, 2, 12)
+    interp = Hermite_Interp(x, np.exp(x), np.exp(x))
+    assert capsys.readouterr().out == ""
+    assert len(interp.coeficientes) == 24
+    pontos = np.linspace(0, 2, 1000).reshape(10, 100)
+    resultado = interp(pontos)
+    assert resultado.shape == (10, 100)
+    assert np.allclose(resultado, np.exp(pontos), atol=1e-12)
+
+
+def test_derivada_e_integral(interp):
+    pontos = np.array([0.5, 2.0, 5.5])
+    assert np.allclose(interp.derivada(pontos), 2*pontos)
+    assert np.allclose(interp.derivada(pontos, 2), 2)
+    assert interp.derivada(3.0) == pytest.approx(6)
+    assert interp.integral(0, 6) == pytest.approx(72)
+    assert interp.prime_safe(1.0) == pytest.approx(2)
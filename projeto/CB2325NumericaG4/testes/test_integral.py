@@ -1,22 +1,414 @@
-from integracao import integral_trap, integral_rect, integral_simpson, monteCarlo
+from integracao import (
+    integral_trap, integral_rect, integral_simpson, integral_simpson_adaptativa, integral_romberg, integral_gauss,
+    integral_trap_dados, integral_simpson_dados, integral_cumulativa_dados, integral_cumulativa, integral_lote, integral_tanh_sinh, integral_multipla, monteCarlo, monteCarlo_nd,
+)
+import integracao
 import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pytest
 
 
 def test_integral_trap():
-    assert abs(integral_trap(math.sin, 0, math.pi, 100000) - 2) < 1e-5
-    assert abs(integral_trap(lambda x: x**2, 0, 1, 100000) - (1/3)) < 1e-5
+    assert abs(integral_trap(math.sin, 0, math.pi, 100000).valor - 2) < 1e-5
+    assert abs(integral_trap(lambda x: x**2, 0, 1, 100000).valor - (1/3)) < 1e-5
 
 def test_integral_rect():
-    assert abs(integral_rect(math.sin, 0, math.pi, 100000) - 2) < 1e-5
-    assert abs(integral_rect(lambda x: x**2, 0, 1, 100000) - (1/3)) < 1e-5
+    assert abs(integral_rect(math.sin, 0, math.pi, 100000).valor - 2) < 1e-5
+    assert abs(integral_rect(lambda x: x**2, 0, 1, 100000).valor - (1/3)) < 1e-5
 
 def test_integral_simpson():
-    assert abs(integral_simpson(math.sin, 0, math.pi, 100000) - 2) < 1e-5
-    assert abs(integral_simpson(lambda x: x**2, 0, 1, 100000) - (1/3)) < 1e-5
+    assert abs(integral_simpson(math.sin, 0, math.pi, 100000).valor - 2) < 1e-5
+    assert abs(integral_simpson(lambda x: x**2, 0, 1, 100000).valor - (1/3)) < 1e-5
 
 def test_monteCarlo():
     f = lambda x, y: x*y
-    assert abs(monteCarlo(0, 1, 0, 1, f, 10000) - 0.25) < 1e-2
+    assert abs(monteCarlo(f, 0, 1, 0, 1, 10000, semente=2).valor - 0.25) < 1e-2
     g = lambda x, y: math.sin(x)*math.cos(y)
-    assert abs(monteCarlo(0, math.pi/2, 0, math.pi/2, g, 10000) - 1) < 1e-2
+    assert abs(monteCarlo(g, 0, math.pi/2, 0, math.pi/2, 10000, semente=2).valor - 1) < 1e-2
+
+@pytest.mark.parametrize("regra", [integral_trap, integral_rect, integral_simpson])
+def test_vetorizado_igual_escalar(regra):
+    vetorizado = regra(np.exp, 0, 2, 1000)
+    escalar = regra(math.exp, 0, 2, 1000, vetorizar=False)
+    assert vetorizado.valor == pytest.approx(escalar.valor, rel=1e-12)
+    assert np.allclose(vetorizado.pontos, escalar.pontos)
+
+def test_uma_chamada_por_no():
+    chamadas = []
+    def f(x):
+        chamadas.append(x)
+        return x**2
+    integral_simpson(f, 0, 1, 10)
+    assert len(chamadas) == 1   # Um único array com todos os nós
+    chamadas.clear()
+    integral_simpson(f, 0, 1, 10, vetorizar=False)
+    assert len(chamadas) == 21  # 2n + 1 nós, cada um avaliado uma vez
+
+def test_funcao_nao_vetorizavel():
+    f = lambda x: x if x > 0.5 else 0.0
+    assert integral_trap(f, 0, 1, 1000).valor == pytest.approx(0.375, abs=1e-3)
+
+def test_record_points_lazy():
+    chamadas = []
+    def f(x):
+        chamadas.append(x)
+        return np.sin(x)
+    integral = integral_trap(f, 0, math.pi, 100)
+    assert len(chamadas) == 1
+    assert integral.n == 100 and integral.regra == "trap"
+    assert integral[0] == pytest.approx((0, 0))      # Os pontos só são gerados aqui
+    assert integral.pontos.shape == (101, 2)
+    assert len(chamadas) == 2
+    integral[-1]
+    assert len(chamadas) == 2   # E ficam guardados para os próximos acessos
+
+@pytest.mark.parametrize("regra", [integral_trap, integral_rect, integral_simpson])
+def test_record_points_modos(regra):
+    full = regra(np.cos, 0, 1, 50, record_points="full")
+    lazy = regra(np.cos, 0, 1, 50, record_points="lazy")
+    off = regra(np.cos, 0, 1, 50, record_points="off")
+    assert np.array_equal(full.pontos, lazy.pontos)
+    assert off.pontos is None
+    with pytest.raises(ValueError):
+        off[0]
+    with pytest.raises(ValueError):
+        regra(np.cos, 0, 1, 50, record_points="todos")
+
+def test_monteCarlo_record_points():
+    f = lambda x, y: x + y
+    full = monteCarlo(f, 0, 1, 0, 2, 100, record_points="full")
+    assert full.pontos.shape == (100, 3)
+    assert np.allclose(full.pontos[:, 2], full.pontos[:, 0] + full.pontos[:, 1])
+    lazy = monteCarlo(f, 0, 1, 0, 2, 100)
+    assert lazy.valor == pytest.approx(np.mean(lazy.pontos[:, 2]) * 2)
+
+def test_simpson_adaptativa():
+    integral = integral_simpson_adaptativa(math.sin, 0, math.pi, tol=1e-10)
+    assert integral.valor == pytest.approx(2, abs=1e-10)
+    assert integral.erro < 1e-10
+    assert integral.avaliacoes == len(integral.pontos)
+    assert np.all(np.diff(integral.pontos[:, 0]) > 0)   # Nenhum nó repetido
+
+def test_simpson_adaptativa_menos_avaliacoes():
+    # A derivada de sqrt é singular em 0: a malha uniforme desperdiça nós longe da singularidade
+    adaptativa = integral_simpson_adaptativa(math.sqrt, 0, 1, tol=1e-9)
+    assert adaptativa.valor == pytest.approx(2/3, abs=1e-9)
+    uniforme = integral_simpson(math.sqrt, 0, 1, n=5 * adaptativa.avaliacoes)
+    assert abs(uniforme.valor - 2/3) > 1e3 * abs(adaptativa.valor - 2/3)
+
+def test_simpson_adaptativa_pico_estreito():
+    pico = lambda x: math.exp(-((x - 0.3)/1e-3)**2)
+    integral = integral_simpson_adaptativa(pico, 0, 1, tol=1e-10, n=100)
+    assert integral.valor == pytest.approx(1e-3*math.sqrt(math.pi), rel=1e-8)
+
+def test_simpson_adaptativa_tol_abaixo_do_arredondamento():
+    # tol=1e-8 é menor que o erro de arredondamento destas integrais: antes a recursão não terminava
+    inicio = time.perf_counter()
+    integral = integral_simpson_adaptativa(lambda x: 1e9*np.sin(x), 0, 3)
+    assert integral.valor == pytest.approx(1e9*(1 - math.cos(3)), rel=1e-12)
+    assert integral_simpson_adaptativa(np.exp, 0, 50).valor == pytest.approx(math.exp(50) - 1, rel=1e-12)
+    assert time.perf_counter() - inicio < 5
+
+def test_simpson_adaptativa_max_avaliacoes():
+    integral = integral_simpson_adaptativa(lambda x: math.sin(1e4*x), 0, 1, max_avaliacoes=1000)
+    assert integral.avaliacoes <= 1000
+    assert integral.erro > 0
+
+def test_romberg():
+    integral = integral_romberg(np.exp, 0, 1, tol=1e-12)
+    assert integral.valor == pytest.approx(math.e - 1, abs=1e-13)
+    assert integral.avaliacoes == integral.n + 1    # Cada nó da malha final avaliado uma única vez
+    assert integral.avaliacoes < 100
+
+def test_romberg_reaproveita_avaliacoes():
+    chamadas = []
+    def f(x):
+        chamadas.append(x)
+        return math.cos(x)
+    integral = integral_romberg(f, 0, 2, tol=1e-10, vetorizar=False, record_points="full")
+    assert len(chamadas) == integral.avaliacoes == len(set(chamadas))
+    assert np.allclose(integral.pontos[:, 0], np.linspace(0, 2, integral.n + 1))
+    assert integral.valor == pytest.approx(math.sin(2), abs=1e-10)
+
+def test_gauss_exata_para_polinomios():
+    # Com 3 nós a regra é exata até o grau 5
+    integral = integral_gauss(lambda x: x**5 - 2*x**2 + 1, -1, 2, ordem=3)
+    assert integral.valor == pytest.approx(10.5 - 6 + 3, abs=1e-12)
+    assert integral.avaliacoes == 3
+
+def test_gauss_composta():
+    integral = integral_gauss(math.exp, 0, 3, ordem=8, m=4)
+    assert integral.valor == pytest.approx(math.exp(3) - 1, abs=1e-12)
+    assert integral.pontos.shape == (32, 2)
+    assert np.all(np.diff(integral.pontos[:, 0]) > 0)
+
+def test_gauss_nos_em_cache():
+    from integracao import _nos_pesos_gauss
+    integral_gauss(np.sin, 0, 1, ordem=17)
+    acertos = _nos_pesos_gauss.cache_info().hits
+    integral_gauss(np.cos, 2, 5, ordem=17, m=3)
+    assert _nos_pesos_gauss.cache_info().hits > acertos
+
+def test_monteCarlo_semente():
+    f = lambda x, y: np.exp(-x*y)
+    i1 = monteCarlo(f, 0, 1, 0, 1, 50_000, semente=42, bloco=7000)
+    i2 = monteCarlo(f, 0, 1, 0, 1, 50_000, semente=42, bloco=7000)
+    assert i1.valor == i2.valor
+    assert np.array_equal(i1.pontos, i2.pontos)
+    assert i1.avaliacoes == 50_000
+
+def test_monteCarlo_erro_padrao():
+    f = lambda x, y: x*y
+    integral = monteCarlo(f, 0, 1, 0, 1, 200_000, semente=1)
+    assert abs(integral.valor - 0.25) < 5*integral.erro
+    assert integral.erro == pytest.approx(np.std(integral.pontos[:, 2], ddof=1)/np.sqrt(200_000))
+
+def test_monteCarlo_parada_antecipada():
+    f = lambda x, y: x + y
+    integral = monteCarlo(f, 0, 1, 0, 1, 10**7, semente=3, tol=1e-3, bloco=10_000)
+    assert integral.erro <= 1e-3
+    assert integral.avaliacoes < 10**7
+    assert integral.pontos.shape == (integral.avaliacoes, 3)
+
+def test_monteCarlo_nao_vetorizavel():
+    g = lambda x, y: math.sin(x)*math.cos(y)
+    integral = monteCarlo(g, 0, math.pi/2, 0, math.pi/2, 5000, semente=0)
+    assert abs(integral.valor - 1) < 5*integral.erro
+
+@pytest.mark.parametrize("metodo", ["uniforme", "antitetico", "estratificado", "sobol", "halton"])
+def test_monteCarlo_nd(metodo):
+    f = lambda x, y, z, w: x*y + z*w**2
+    integral = monteCarlo_nd(f, [(0, 1), (0, 2), (0, 1), (-1, 1)], 40_000, metodo, semente=7, bloco=5000)
+    assert integral.valor == pytest.approx(2 + 2/3, abs=5*integral.erro)
+    assert integral.avaliacoes <= 40_000
+    assert integral.pontos.shape == (integral.avaliacoes, 5)
+
+def test_monteCarlo_nd_reducao_de_variancia():
+    f = lambda *x: np.exp(-sum(xi**2 for xi in x))
+    limites = [(0, 1)]*5
+    uniforme = monteCarlo_nd(f, limites, 2**15, "uniforme", semente=0)
+    for metodo in ("estratificado", "sobol"):
+        assert monteCarlo_nd(f, limites, 2**15, metodo, semente=0).erro < uniforme.erro/3
+
+def test_monteCarlo_nd_reprodutivel():
+    f = lambda x, y: np.cos(x + y)
+    i1 = monteCarlo_nd(f, [(0, 1), (0, 1)], 5000, "halton", semente=5, record_points="full")
+    i2 = monteCarlo_nd(f, [(0, 1), (0, 1)], 5000, "halton", semente=5)
+    assert i1.valor == i2.valor
+    assert np.array_equal(i1.pontos, i2.pontos)
+    with pytest.raises(ValueError):
+        monteCarlo_nd(f, [(0, 1), (0, 1)], 5000, "latin")
+
+def integrando_python(x, y):
+    # Função escalar no nível do módulo, para poder ser enviada a outros processos
+    return math.exp(-x*y) if x < y else math.cos(x*y)
+
+def test_monteCarlo_paralelo_reprodutivel():
+    serial = monteCarlo(integrando_python, 0, 1, 0, 2, 20_000, semente=11, bloco=3000)
+    processos = monteCarlo(integrando_python, 0, 1, 0, 2, 20_000, semente=11, bloco=3000, workers=2)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        threads = monteCarlo(integrando_python, 0, 1, 0, 2, 20_000, semente=11, bloco=3000, executor=executor,
+                             record_points="full")
+    assert serial.valor == processos.valor == threads.valor
+    assert serial.erro == processos.erro == threads.erro
+    assert np.array_equal(serial.pontos, threads.pontos)
+
+def test_monteCarlo_paralelo_parada_antecipada():
+    integral = monteCarlo(np.hypot, 0, 1, 0, 1, 10**6, semente=4, tol=2e-3, bloco=1000, workers=2)
+    assert integral.erro <= 2e-3
+    assert integral.avaliacoes < 10**6
+    assert integral.valor == pytest.approx(0.7652, abs=5*integral.erro)
+
+@pytest.mark.parametrize("regra", [integral_trap, integral_rect, integral_simpson])
+def test_quadratura_paralela(regra):
+    serial = regra(np.sin, 0, 3, 10_001)
+    processos = regra(np.sin, 0, 3, 10_001, workers=2, record_points="full")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        threads = regra(lambda x: math.sin(x), 0, 3, 10_001, executor=executor)
+    assert processos.valor == pytest.approx(serial.valor, abs=1e-13)
+    assert threads.valor == pytest.approx(serial.valor, abs=1e-13)
+    assert np.array_equal(processos.pontos, serial.pontos)
+
+def test_soma_compensada():
+    # Valores de magnitudes muito diferentes: a soma em pares perde os termos pequenos
+    f = lambda x: np.where(np.round(1000*x) % 2 == 0, 1e15, -1e15) + 0.1
+    exato = 0.125       # 1e15 + 0.1 e -1e15 + 0.1 são arredondados para ±1e15 + 0.125
+    assert integral_rect(f, 0, 1, 1000, soma="compensada").valor == exato
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert integral_rect(f, 0, 1, 1000, soma="compensada", executor=executor).valor == exato
+    assert integral_rect(f, 0, 1, 1000).valor != exato
+
+def test_soma_modos():
+    for regra in (integral_trap, integral_simpson, integral_romberg, integral_gauss, integral_tanh_sinh):
+        assert regra(np.exp, 0, 1, soma="compensada").valor == pytest.approx(math.e - 1, abs=1e-6)
+    with pytest.raises(ValueError):
+        integral_tanh_sinh(np.exp, 0, 1, soma="kahan")
+    integral = monteCarlo(np.hypot, 0, 1, 0, 1, 10_000, semente=1, soma="compensada")
+    assert integral.valor == pytest.approx(monteCarlo(np.hypot, 0, 1, 0, 1, 10_000, semente=1).valor, rel=1e-12)
+    with pytest.raises(ValueError):
+        integral_trap(np.exp, 0, 1, soma="kahan")
+
+@pytest.fixture
+def dados_nao_uniformes():
+    x = np.sort(np.random.default_rng(0).uniform(0, 2, 501))
+    x[0], x[-1] = 0, 2
+    return x, np.exp(x)
+
+def test_trap_dados(dados_nao_uniformes):
+    x, y = dados_nao_uniformes
+    integral = integral_trap_dados(x, y)
+    assert integral.valor == pytest.approx(math.exp(2) - 1, rel=1e-4)
+    assert integral.min == 0 and integral.max == 2
+    assert integral.func.keywords["xp"] is x      # Os dados não são copiados
+    assert np.array_equal(integral.pontos, np.column_stack((x, y)))
+    assert integral.func(1.0) == pytest.approx(math.e, rel=1e-3)
+
+def test_simpson_dados(dados_nao_uniformes):
+    x, y = dados_nao_uniformes
+    assert integral_simpson_dados(x, y).valor == pytest.approx(math.exp(2) - 1, rel=1e-8)
+    assert integral_simpson_dados(x[:-1], y[:-1]).valor == pytest.approx(math.exp(x[-2]) - 1, rel=1e-8)
+    # Exata para parábolas, inclusive com número ímpar de intervalos
+    x = np.array([0, 0.3, 1.0, 1.2, 2.5, 3.0])
+    assert integral_simpson_dados(x, x**2).valor == pytest.approx(9, abs=1e-12)
+
+def test_cumulativa_dados(dados_nao_uniformes):
+    x, y = dados_nao_uniformes
+    F = integral_cumulativa_dados(x, y)
+    assert F[0] == 0
+    assert np.allclose(F, np.exp(x) - 1, rtol=1e-4)
+    assert F[-1] == pytest.approx(integral_trap_dados(x, y).valor)
+
+def test_dados_invalidos():
+    with pytest.raises(ValueError):
+        integral_trap_dados([0, 1, 2], [1, 2])
+    with pytest.raises(ValueError):
+        integral_simpson_dados([0, 2, 1], [1, 2, 3])
+
+def test_integral_cumulativa():
+    F = integral_cumulativa(np.cos, 0, 4, 200)
+    assert F.valor == pytest.approx(math.sin(4), abs=1e-9)
+    assert np.allclose(F.F, np.sin(F.x), atol=1e-9)
+    t = np.linspace(0, 4, 1001)
+    assert np.allclose(F(t), np.sin(t), atol=1e-8)      # Entre os nós, pela interpolação de Hermite
+    assert F(1.2345) == pytest.approx(math.sin(1.2345), abs=1e-8)
+    assert math.isnan(F(5))
+
+def test_integral_cumulativa_uma_avaliacao():
+    chamadas = []
+    def f(x):
+        chamadas.append(x)
+        return x**2
+    F = integral_cumulativa(f, 0, 3, 30)
+    assert len(chamadas) == 1
+    assert np.allclose(F([1, 2, 3]), [1/3, 8/3, 9])
+
+@pytest.mark.parametrize("regra, n", [("trap", 2000), ("simpson", 50), ("gauss", 12)])
+def test_integral_lote_intervalos(regra, n):
+    a = np.zeros(1000)
+    b = np.linspace(0.1, 3, 1000)
+    valores = integral_lote(np.sin, a, b, n, regra=regra)
+    assert valores.shape == (1000,)
+    assert np.allclose(valores, 1 - np.cos(b), atol=1e-6)
+
+def test_integral_lote_parametros():
+    k = np.arange(1, 6)
+    valores = integral_lote(lambda x, p: np.exp(-p*x), 0, 1, 20, parametros=k, regra="gauss")
+    assert np.allclose(valores, (1 - np.exp(-k))/k, atol=1e-13)
+
+def test_integral_lote_igual_a_simpson():
+    chamadas = []
+    def f(x):
+        chamadas.append(x)
+        return np.cos(x)
+    a, b = np.array([[0, 1], [2, 3]]), 4
+    valores, integrais = integral_lote(f, a, b, 100, bloco=250, retornar_integrais=True)
+    assert valores.shape == (2, 2)
+    assert len(chamadas) == 4       # Uma chamada por bloco de linhas
+    for valor, integral, ai in zip(valores.ravel(), integrais, a.ravel()):
+        assert valor == pytest.approx(integral_simpson(np.cos, ai, 4, 100).valor, abs=1e-14)
+        assert integral.valor == valor and integral.min == ai
+    assert integrais[1].pontos.shape == (201, 2)
+
+def test_integral_lote_nao_vetorizavel():
+    valores = integral_lote(lambda x, p: math.sin(p*x), 0, math.pi, 40, parametros=[1, 2], regra="gauss")
+    assert np.allclose(valores, [2, 0], atol=1e-10)
+
+def test_integral_tanh_sinh_limites_infinitos():
+    assert integral_tanh_sinh(lambda x: np.exp(-x), 0, np.inf).valor == pytest.approx(1, abs=1e-12)
+    assert integral_tanh_sinh(lambda x: np.exp(-x**2), -np.inf, np.inf).valor == pytest.approx(math.sqrt(math.pi), abs=1e-12)
+    assert integral_tanh_sinh(lambda x: 1/(1 + x**2), -np.inf, 0).valor == pytest.approx(math.pi/2, abs=1e-12)
+    assert integral_tanh_sinh(lambda x: 1/(1 + x**2), np.inf, 1).valor == pytest.approx(-math.pi/4, abs=1e-12)
+
+def test_integral_tanh_sinh_singularidades():
+    integral = integral_tanh_sinh(lambda x: 1/np.sqrt(x), 0, 1, record_points="full")
+    assert integral.valor == pytest.approx(2, abs=1e-12)
+    assert integral.erro < 1e-10 and integral.avaliacoes == len(integral.pontos)
+    assert np.all((integral.pontos[:, 0] > 0) & (integral.pontos[:, 0] < 1))
+    assert integral_tanh_sinh(math.log, 0, 1, vetorizar=False).valor == pytest.approx(-1, abs=1e-12)
+
+def test_integral_multipla_retangulo_e_caixa():
+    f = lambda x, y, z: np.sin(x + y + z)
+    exato = (((np.exp(1j) - 1)/1j)**3).imag
+    assert integral_multipla(f, [(0, 1)]*3, 10).valor == pytest.approx(exato, abs=1e-13)
+    assert integral_multipla(f, [(0, 1)]*3, 40, "simpson", bloco=1000).valor == pytest.approx(exato, abs=1e-8)
+    integral = integral_multipla(lambda x, y: x*y**2, [(0, 1), (0, 2)], 3, record_points="full")
+    assert integral.valor == pytest.approx(4/3, abs=1e-14)
+    assert integral.avaliacoes == 9 and integral.pontos.shape == (9, 3)
+
+def test_integral_multipla_limites_variaveis():
+    integral = integral_multipla(lambda x, y, z: x*y*z, [(0, 1), (0, lambda x: x), (0, lambda x, y: y)], 4, bloco=10)
+    assert integral.valor == pytest.approx(1/48, abs=1e-14)
+    integral = integral_multipla(lambda x, y: math.exp(x + y), [(0, 1), (lambda x: x, 1)], 8, vetorizar=False)
+    assert integral.valor == pytest.approx((math.e - 1)**2/2, abs=1e-12)
+
+@pytest.mark.parametrize("d, n", [(6, 100), (6, 5000), (10, 1000)])
+def test_monteCarlo_nd_estratificado_usa_o_orcamento(d, n):
+    integral = monteCarlo_nd(lambda *x: sum(x), [(0, 1)]*d, n, semente=3)
+    assert 0.9*n <= integral.avaliacoes <= n
+    assert integral.valor == pytest.approx(d/2, abs=6*integral.erro + 1e-12)
+
+def test_integral_lote_pontos_preguicosos():
+    _, integrais = integral_lote(np.sin, np.linspace(0, 1, 50), 2, 100, retornar_integrais=True)
+    assert all(callable(integral._pontos) for integral in integrais)    # Nada foi gerado ainda
+    pontos = integrais[10].pontos
+    assert pontos.shape == (201, 2)
+    assert pontos[0, 0] == pytest.approx(10/49) and pontos[-1, 0] == 2
+    assert np.allclose(pontos[:, 1], np.sin(pontos[:, 0]))
+    assert callable(integrais[11]._pontos)
+
+def test_integral_cumulativa_limites_invertidos():
+    F = integral_cumulativa(np.cos, 1, 0, 10)
+    assert F.valor == pytest.approx(-math.sin(1), abs=1e-6)
+    assert F(1.0) == 0
+    assert F(0.0) == pytest.approx(F.valor)
+    assert np.allclose(F([0.25, 0.5]), np.sin([0.25, 0.5]) - math.sin(1), atol=1e-6)
+    assert np.isnan(F(1.5)) and F.min == 1 and F.max == 0
+
+def test_soma_modos_cumulativas_e_lote():
+    x = np.linspace(0, 1, 1001)
+    y = np.where(np.arange(1001) % 2 == 0, 1e15, -1e15) + 0.1
+    F = integral_cumulativa_dados(x, y, soma="compensada")
+    incrementos = (np.diff(x)*(y[1:] + y[:-1])/2).tolist()
+    assert F[-1] == math.fsum(incrementos)
+    assert np.array_equal(F[1:], [math.fsum(incrementos[:i + 1]) for i in range(1000)])
+    G = integral_cumulativa(np.cos, 0, 4, 200, soma="compensada")
+    assert G.valor == pytest.approx(math.sin(4), abs=1e-9)
+    valores = integral_lote(np.sin, 0, [1, 2, 3], 50, soma="compensada")
+    assert np.allclose(valores, integral_lote(np.sin, 0, [1, 2, 3], 50), rtol=1e-13)
+    for chamada in (lambda: integral_cumulativa_dados(x, y, soma="kahan"),
+                    lambda: integral_cumulativa(np.cos, 0, 1, soma="kahan"),
+                    lambda: integral_lote(np.sin, 0, 1, soma="kahan")):
+        with pytest.raises(ValueError):
+            chamada()
+
+def test_soma_compensada_igual_a_fsum():
+    rng = np.random.default_rng(4)
+    x = rng.normal(size=200_000) * 10.0**rng.integers(-8, 16, size=200_000)
+    x = np.concatenate((x, -x[:150_000]))
+    rng.shuffle(x)
+    assert integracao._soma_compensada(x) == math.fsum(x.tolist())
+    assert integracao._soma_compensada([1e16, 1.0, -1e16]) == 1.0
+    assert integracao._soma_compensada([]) == 0.0
+    assert integracao._soma_compensada([np.inf, 1.0]) == np.inf
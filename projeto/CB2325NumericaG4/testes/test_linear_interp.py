@@ -30,8 +30,8 @@ def test_interpolacao_vetor(interp):
 
 
 def test_extrapolacao(interp):
-    assert interp(-1.0) is None
-    assert interp(7.0) is None
+    assert np.isnan(interp(-1.0))
+    assert np.isnan(interp(7.0))
 
 def test_valores_x_repetidos():
     x = [0, 2, 2, 4]
@@ -54,3 +54,25 @@ def test_interpolacao_lista(interp):
     assert np.allclose(resultado, esperado)
 
 
+
+def test_vetor_fora_do_dominio(interp):
+    resultado = interp(np.array([[-1.0, 0.5], [5.0, 7.0]]))
+    assert resultado.shape == (2, 2)
+    assert np.isnan(resultado[0, 0]) and np.isnan(resultado[1, 1])
+    assert np.allclose(resultado[0, 1], 1) and np.allclose(resultado[1, 0], 4.5)
+
+def test_muitos_pontos_igual_np_interp():
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.uniform(0, 10, 1000))
+    y = np.sin(x)
+    pontos = rng.uniform(x[0], x[-1], 10000)
+    assert np.allclose(Linear_Interp(x, y)(pontos), np.interp(pontos, x, y))
+
+def test_derivada_e_integral(interp):
+    assert np.allclose(interp.derivada([0.5, 2.0, 3.5, 5.0]), [2, -0.5, 4, -0.5])
+    assert interp.derivada(1.0) == 2       # nos nós internos, a inclinação à esquerda
+    assert interp.derivada(2.0, 2) == 0
+    assert np.isnan(interp.derivada(7.0))
+    assert interp.integral(0, 6) == pytest.approx(np.trapezoid(interp.y, interp.x))
+    assert interp.integral(0.5, 2.0) == pytest.approx(0.75 + 1.75)
+    assert np.isnan(interp.integral(-1, 2))
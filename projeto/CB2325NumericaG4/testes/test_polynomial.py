@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from utils import Polynomial
+from interpolacao import Poly_Interp, Hermite_Interp
+from aproximacao import regressao_polinomial
+
+
+@pytest.fixture
+def p():
+    return Polynomial([1, -2, 0, 3])    # 1 - 2x + 3x^3
+
+
+def test_avaliacao(p):
+    assert p(2.0) == 21
+    assert isinstance(p(2.0), float)
+    assert np.allclose(p(np.array([[0, 1], [-1, 2]])), [[1, 2], [0, 21]])
+    assert p.grau == 3 and p.coef.flags['C_CONTIGUOUS']
+    assert Polynomial([1, 2, 0, 0]).grau == 1
+
+
+def test_chebyshev(p):
+    c = p.para_chebyshev(0, 4)
+    pontos = np.linspace(-1, 5, 13)
+    assert c.base == "chebyshev"
+    assert np.allclose(c(pontos), p(pontos))
+    assert np.allclose(c.para_monomial().coef, p.coef)
+    assert np.allclose(Polynomial([0, 0, 1], "chebyshev")(pontos), 2*pontos**2 - 1)
+
+
+def test_derivada_e_integral(p):
+    for q in (p, p.para_chebyshev(-2, 3)):
+        assert q.derivada()(2.0) == pytest.approx(34)
+        assert q.derivada(2)(2.0) == pytest.approx(36)
+        assert q.derivada(4)(2.0) == pytest.approx(0)
+        assert q.integral(0, 1) == pytest.approx(0.75)
+        assert q.prime(1.0) == pytest.approx(7)
+
+
+def test_aritmetica(p):
+    x = Polynomial([0, 1])
+    pontos = np.linspace(-2, 2, 9)
+    assert np.allclose((p*x)(pontos), pontos*p(pontos))
+    assert np.allclose((2 - p + x)(pontos), 2 - p(pontos) + pontos)
+    assert np.allclose((3*p.para_chebyshev(-2, 2) - p)(pontos), 2*p(pontos))
+    assert p - p == Polynomial([0])
+
+
+def test_conversao_da_forma_de_newton():
+    x = np.array([0, 0.5, 1.2, 2, 3])
+    interp = Poly_Interp(x, np.exp(x))
+    pontos = np.linspace(0, 3, 31)
+    assert np.allclose(interp.polinomio()(pontos), interp(pontos))
+    assert np.allclose(interp.polinomio("chebyshev")(pontos), interp(pontos))
+    hermite = Hermite_Interp([0, 1, 2], [0, 1, 8], [0, 3, 12])
+    assert np.allclose(hermite.polinomio().coef, [0, 0, 0, 1], atol=1e-12)
+    assert hermite.polinomio("chebyshev", (-1, 3))(1.5) == pytest.approx(1.5**3)
+
+
+def test_regressao_polinomial_retorna_polynomial():
+    coeficientes, _, f, _ = regressao_polinomial(x=[1, 2, 3, 4], y=[3, 6, 9, 11], grau=2)
+    assert isinstance(f, Polynomial)
+    assert np.allclose(f.coef, coeficientes)
+    assert f(2.5) == pytest.approx(coeficientes @ [1, 2.5, 2.5**2])
+
+
+def test_um_ponto_base_monomial():
+    assert Poly_Interp([2.0], [3.0]).polinomio()(5.0) == 3
+    assert Hermite_Interp([1.0], [2.0], [3.0]).polinomio()(2.0) == pytest.approx(5)
+    with pytest.raises(ValueError):
+        Poly_Interp([2.0], [3.0]).polinomio("chebyshev")
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from interpolacao import Spline_Interp
+
+
+@pytest.fixture
+def dados():
+    x = np.array([0.0, 0.7, 1.5, 2.0, 3.2, 4.0])
+    return x, np.sin(x)
+
+
+def test_pontos_conhecidos(dados):
+    x, y = dados
+    for contorno in ("natural", "not-a-knot"):
+        assert np.allclose(Spline_Interp(x, y, contorno)(x), y)
+    assert isinstance(Spline_Interp(x, y)(1.0), float)
+
+
+def test_natural_segunda_derivada_nula(dados):
+    spline = Spline_Interp(*dados)
+    c = spline.coeficientes
+    assert c.shape == (4, 5)
+    assert c[2, 0] == pytest.approx(0, abs=1e-12)
+    assert 2*c[2, -1] + 6*c[3, -1]*spline.h[-1] == pytest.approx(0, abs=1e-12)
+
+
+def test_fixo_derivadas_nos_extremos(dados):
+    x, y = dados
+    spline = Spline_Interp(x, y, "fixo", derivadas=(np.cos(0), np.cos(4)))
+    c, h = spline.coeficientes, spline.h
+    assert c[1, 0] == pytest.approx(1)
+    assert c[1, -1] + 2*c[2, -1]*h[-1] + 3*c[3, -1]*h[-1]**2 == pytest.approx(np.cos(4))
+
+
+def test_not_a_knot_reproduz_cubica():
+    x = [0, 1, 2.5, 3, 5]
+    f = lambda t: t**3 - 2*t + 1
+    spline = Spline_Interp(x, f(np.array(x, dtype=float)), "not-a-knot")
+    pontos = np.linspace(0, 5, 41)
+    assert np.allclose(spline(pontos), f(pontos))
+    assert np.allclose(Spline_Interp([0, 1, 3], [1, 0, 4], "not-a-knot")([0.5, 2]), [0.25, 1])
+
+
+def test_convergencia_e_dominio():
+    x = np.linspace(0, 2*np.pi, 200)
+    spline = Spline_Interp(x, np.sin(x), "fixo", derivadas=(1, 1))
+    pontos = np.linspace(0, 2*np.pi, 1001)
+    assert np.allclose(spline(pontos), np.sin(pontos), atol=1e-8)
+    assert np.isnan(spline(-0.1)) and np.isnan(spline([7.0])[0])
+
+
+def test_erros():
+    with pytest.raises(ValueError):
+        Spline_Interp([0, 1, 2], [0, 1, 0], "periodico")
+    with pytest.raises(ValueError):
+        Spline_Interp([0, 1, 2], [0, 1, 0], "fixo")
+    with pytest.raises(ZeroDivisionError):
+        Spline_Interp([0, 1, 1], [0, 1, 0])
+
+
+def test_derivada_e_integral():
+    x = np.linspace(0, np.pi, 100)
+    spline = Spline_Interp(x, np.sin(x), "fixo", derivadas=(1, -1))
+    pontos = np.linspace(0.1, 3, 7)
+    assert np.allclose(spline.derivada(pontos), np.cos(pontos), atol=1e-6)
+    assert np.allclose(spline.derivada(pontos, 2), -np.sin(pontos), atol=1e-3)
+    assert np.all(spline.derivada(pontos, 4) == 0)
+    assert spline.integral(0, np.pi) == pytest.approx(2, abs=1e-8)
+    assert np.allclose(spline.integral(0, pontos), 1 - np.cos(pontos), atol=1e-8)
+    assert np.isnan(spline.derivada(4.0))
@@ -101,7 +101,7 @@ class InterpBase(RealFunction):
 
         self.domain = Interval(self.x[0], self.x[-1])        
         self.f = self.__call__
-        self.prime = None
+        self.prime = getattr(self, 'derivada', None)     # Derivada analítica, se a classe filha a implementar
 
     def __call__(self, x_desejado):
         raise NotImplementedError("A classe filha implementa a __call__")
@@ -117,23 +117,6 @@ class InterpBase(RealFunction):
         """
         Cria um gráfico com o interpolador e os pontos dados.
         """
-        curva_x = np.linspace(self.domain.min, self.domain.max, max(500, 10 * self.n))
-
-        # Para Hermite, use valor_polinomio diretamente
-        if hasattr(self, 'dy') and self.dy is not None:
-            # É uma interpolação de Hermite
-            y_interp = self.valor_polinomio(curva_x)
-        else:
-            # Para outras interpolações, use o método padrão
-            try:
-                y_interp = self(curva_x)  # Tenta usar __call__
-            except (AttributeError, TypeError):
-                try:
-                    y_interp = self.valor_polinomio(curva_x)
-                except AttributeError:
-                    y_interp = np.array([self(x) for x in curva_x])
-                    
-        
         curva_x = np.linspace(self.domain.min, self.domain.max, max(500, 10 * self.n))
         y_interp = self(curva_x)
 
@@ -164,4 +147,213 @@ class InterpBase(RealFunction):
                   fig.savefig(salvar_como)
                   print(f"Gráfico salvo em: {salvar_como}")
               except Exception as e:
-                  print(f"Erro ao salvar o gráfico: {e}")
\ No newline at end of file
+                  print(f"Erro ao salvar o gráfico: {e}")
+
+class Polynomial(RealFunction):
+    """
+    Polinômio como valor compacto: os coeficientes ficam em um array contíguo de floats,
+    em ordem crescente de grau, em uma de duas bases:
+        "monomial" - p(x) = sum_k c_k x^k, avaliado pelo método de Horner;
+        "chebyshev" - p(x) = sum_k c_k T_k(u), com u = (2x - a - b)/(b - a) levando o
+        intervalo [a, b] em [-1, 1], avaliado pelo algoritmo de Clenshaw.
+    A avaliação é vetorizada sobre todos os pontos (o laço é só sobre o grau).
+    """
+
+    def __init__(self, coeficientes, base="monomial", intervalo=(-1, 1)):
+        if base not in ("monomial", "chebyshev"):
+            raise ValueError("Base inválida!")
+        coef = np.atleast_1d(np.array(coeficientes, dtype=float))
+        if coef.ndim != 1:
+            raise TypeError("Os coeficientes devem formar uma lista unidimensional")
+        # Remove os coeficientes nulos dos graus mais altos (mantendo pelo menos um)
+        nao_nulos = np.flatnonzero(coef)
+        self.coef = np.ascontiguousarray(coef[:nao_nulos[-1] + 1] if len(nao_nulos) else coef[:1])
+        self.base = base
+        self.intervalo = (float(intervalo[0]), float(intervalo[1]))
+        if base == "chebyshev" and self.intervalo[0] == self.intervalo[1]:
+            raise ValueError("O intervalo da base de Chebyshev não pode ser degenerado")
+
+        self.f = self.__call__
+        self.prime = self._derivada_em
+
+    @classmethod
+    def de_newton(cls, coeficientes, nos, base="monomial", intervalo=(-1, 1)):
+        """
+        Converte a forma de Newton p(x) = c_0 + (x - x_0)(c_1 + (x - x_1)(c_2 + ...))
+        para a base escolhida, pela mesma recorrência de Horner, aplicada aos vetores
+        de coeficientes: p <- p*(x - x_i) + c_i. Custo O(n^2), sem laços sobre os termos.
+
+        Parâmetros:
+        coeficientes (list): Coeficientes c_i da forma de Newton;
+        nos (list): Nós x_i da forma de Newton (ao menos len(coeficientes) - 1);
+        base (str): "monomial" ou "chebyshev";
+        intervalo (tuple): Intervalo [a, b] da base de Chebyshev.
+
+        Retorna: Um Polynomial.
+        """
+        coeficientes = np.asarray(coeficientes, dtype=float)
+        nos = np.asarray(nos, dtype=float)
+        a, b = intervalo
+        alfa, beta = (b - a)/2, (a + b)/2       # x = alfa*u + beta
+
+        p = coeficientes[-1:].copy()
+        for i in range(len(coeficientes) - 2, -1, -1):
+            q = np.zeros(len(p) + 1)
+            if base == "monomial":
+                q[1:] += p
+                q[:-1] -= nos[i]*p
+            else:
+                # u T_k = (T_{k+1} + T_{|k-1|})/2, com u T_0 = T_1
+                q[1:] += alfa*p/2
+                q[:-2] += alfa*p[1:]/2
+                q[1] += alfa*p[0]/2
+                q[:-1] += (beta - nos[i])*p
+            q[0] += coeficientes[i]
+            p = q
+        return cls(p, base, intervalo)
+
+    @property
+    def grau(self):
+        return len(self.coef) - 1
+
+    def _u(self, x):
+        a, b = self.intervalo
+        return (2*x - a - b)/(b - a)
+
+    def __call__(self, x):
+        """
+        Avalia o polinômio em todos os pontos de uma só vez.
+
+        Parâmetros:
+        x (float ou list): Coordenada(s) onde o polinômio é avaliado.
+
+        Retorna: Um Array com os valores (ou um float, se x for um único número).
+        """
+        escalar = np.ndim(x) == 0
+        x = np.asarray(x, dtype=float)
+
+        if self.base == "monomial":
+            valores = np.full(x.shape, self.coef[-1])
+            for c in self.coef[-2::-1]:
+                valores *= x
+                valores += c
+        else:
+            u2 = 2*self._u(x)
+            b1, b2 = np.zeros(x.shape), np.zeros(x.shape)
+            for c in self.coef[:0:-1]:
+                b1, b2 = c + u2*b1 - b2, b1
+            valores = self.coef[0] + u2/2*b1 - b2
+
+        if escalar:
+            return valores.item()
+        return valores
+
+    def _numpy(self):
+        """
+        Representação equivalente do módulo numpy.polynomial, usada nas conversões.
+        """
+        if self.base == "monomial":
+            return np.polynomial.Polynomial(self.coef)
+        return np.polynomial.Chebyshev(self.coef, domain=self.intervalo)
+
+    def para_monomial(self):
+        """
+        Retorna: O mesmo polinômio na base monomial.
+        """
+        if self.base == "monomial":
+            return self
+        return Polynomial(self._numpy().convert(kind=np.polynomial.Polynomial).coef)
+
+    def para_chebyshev(self, a=-1, b=1):
+        """
+        Retorna: O mesmo polinômio na base de Chebyshev do intervalo [a, b].
+        """
+        if self.base == "chebyshev" and self.intervalo == (a, b):
+            return self
+        convertido = self._numpy().convert(kind=np.polynomial.Chebyshev, domain=[a, b])
+        return Polynomial(convertido.coef, "chebyshev", (a, b))
+
+    def derivada(self, ordem=1):
+        """
+        Retorna: O Polynomial derivada de ordem 'ordem', na mesma base.
+        """
+        if self.base == "monomial":
+            coef = np.polynomial.polynomial.polyder(self.coef, ordem)
+        else:
+            a, b = self.intervalo
+            coef = np.polynomial.chebyshev.chebder(self.coef, ordem, scl=2/(b - a))
+        return Polynomial(coef if len(coef) else [0.0], self.base, self.intervalo)
+
+    def _derivada_em(self, x):
+        return self.derivada()(x)
+
+    def primitiva(self):
+        """
+        Retorna: O Polynomial primitiva, na mesma base (a primitiva que se anula em
+        x = 0 na base monomial e em u = 0 na base de Chebyshev).
+        """
+        if self.base == "monomial":
+            coef = np.polynomial.polynomial.polyint(self.coef)
+        else:
+            a, b = self.intervalo
+            coef = np.polynomial.chebyshev.chebint(self.coef, scl=(b - a)/2)
+        return Polynomial(coef, self.base, self.intervalo)
+
+    def integral(self, a, b):
+        """
+        Retorna: A integral exata do polinômio de a até b (um array, se a ou b forem listas).
+        """
+        F = self.primitiva()
+        return F(b) - F(a)
+
+    def _compatibilizar(self, outro):
+        """
+        Converte 'outro' (número ou Polynomial) para a base e o intervalo deste polinômio.
+        """
+        if isinstance(outro, Polynomial):
+            if self.base == "monomial":
+                return outro.para_monomial().coef
+            return outro.para_chebyshev(*self.intervalo).coef
+        if np.ndim(outro) == 0:
+            return np.array([float(outro)])
+        return NotImplemented
+
+    def __add__(self, outro):
+        c = self._compatibilizar(outro)
+        if c is NotImplemented:
+            return c
+        soma = np.polynomial.polynomial.polyadd(self.coef, c)
+        return Polynomial(soma, self.base, self.intervalo)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Polynomial(-self.coef, self.base, self.intervalo)
+
+    def __sub__(self, outro):
+        return self + (-outro)
+
+    def __rsub__(self, outro):
+        return (-self) + outro
+
+    def __mul__(self, outro):
+        c = self._compatibilizar(outro)
+        if c is NotImplemented:
+            return c
+        if self.base == "monomial":
+            produto = np.polynomial.polynomial.polymul(self.coef, c)
+        else:
+            produto = np.polynomial.chebyshev.chebmul(self.coef, c)
+        return Polynomial(produto, self.base, self.intervalo)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, outro):
+        if not isinstance(outro, Polynomial):
+            return NotImplemented
+        return (self.base, self.intervalo) == (outro.base, outro.intervalo) and np.array_equal(self.coef, outro.coef)
+
+    def __repr__(self):
+        if self.base == "monomial":
+            return f"Polynomial(grau={self.grau}, coef={self.coef})"
+        return f"Polynomial(grau={self.grau}, base=chebyshev, intervalo={self.intervalo}, coef={self.coef})"